@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.user.user_controller import router as user_router
 from src.truck.truck_controller import router as truck_router
 from src.warehouse.warehouse_controller import router as warehouse_router
@@ -27,8 +28,11 @@ from ia.donation_suggestions.donation_suggestions_controller import (
     router as donation_suggestions_router,
 )
 from src.analytics.analytics_controller import router as analytics_router
+from src.database import warm_up_pool
 
-app = FastAPI(title="Supply Chain Management API")
+app = FastAPI(
+    title="Supply Chain Management API", default_response_class=ORJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -60,6 +64,11 @@ app.include_router(donation_suggestions_router)
 app.include_router(analytics_router)
 
 
+@app.on_event("startup")
+async def startup():
+    await warm_up_pool()
+
+
 @app.get("/")
 async def root():
     return {"message": "Supply Chain Management API is running"}
@@ -1,3 +1,11 @@
-from .location import Location
+from .location import Location, haversine_distances_km
+from .cache import TTLCache, invalidate_after_commit
+from .etag import etag_json_response
 
-__all__ = ["Location"]
+__all__ = [
+    "Location",
+    "TTLCache",
+    "etag_json_response",
+    "haversine_distances_km",
+    "invalidate_after_commit",
+]
@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Session.info key holding (cache, key) pairs to drop once the session commits
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries"""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key from the cache if present"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def invalidate_after_commit(
+    session: AsyncSession, cache: TTLCache, key: Optional[Hashable] = None
+) -> None:
+    """Drop key (or every entry when key is None) now and again after the commit
+
+    A reader running before the commit lands still sees the old row and may
+    re-cache it, so dropping the entry inside the transaction is not enough.
+    """
+    _invalidate(cache, key)
+    session.sync_session.info.setdefault(_PENDING_INVALIDATIONS, []).append(
+        (cache, key)
+    )
+
+
+def _invalidate(cache: TTLCache, key: Optional[Hashable]) -> None:
+    if key is None:
+        cache.clear()
+    else:
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_invalidations(session: Session) -> None:
+    for cache, key in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        _invalidate(cache, key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
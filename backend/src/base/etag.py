@@ -0,0 +1,19 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+
+def etag_json_response(
+    request: Request, adapter: TypeAdapter, payload: Any
+) -> Response:
+    """Serialize payload and answer 304 when the client already holds this body"""
+    body = adapter.dump_json(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -1,6 +1,14 @@
 from pydantic import BaseModel, Field, validator
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
+from functools import lru_cache
 import math
+import struct
+import numpy as np
+
+EARTH_RADIUS_KM = 6371
+
+# Geometry type flag PostGIS sets in EWKB when an SRID follows the type
+_EWKB_SRID_FLAG = 0x20000000
 
 
 class Location(BaseModel):
@@ -47,16 +55,25 @@ class Location(BaseModel):
     @classmethod
     def from_db_row(cls, row) -> Optional["Location"]:
         """Create Location from database row with longitude/latitude/address attributes"""
-        longitude = (
-            getattr(row, "longitude", None) if hasattr(row, "longitude") else None
-        )
-        latitude = getattr(row, "latitude", None) if hasattr(row, "latitude") else None
-        address = getattr(row, "address", None) if hasattr(row, "address") else None
+        longitude = getattr(row, "longitude", None)
+        latitude = getattr(row, "latitude", None)
+        address = getattr(row, "address", None)
 
         if longitude is not None and latitude is not None:
             return cls(latitude=latitude, longitude=longitude, address=address)
         return None
 
+    @classmethod
+    def from_wkb(cls, wkb, address: Optional[str] = None) -> Optional["Location"]:
+        """Create Location from a WKB/EWKB point, such as a geoalchemy2 WKBElement"""
+        if wkb is None:
+            return None
+
+        data = getattr(wkb, "data", wkb)
+        data = bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+
+        return _location_from_wkb_bytes(data, address)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for easy serialization"""
         result = {"latitude": self.latitude, "longitude": self.longitude}
@@ -75,7 +92,7 @@ class Location(BaseModel):
         if not isinstance(other, Location):
             raise ValueError("other must be a Location instance")
 
-        R = 6371  # Earth's radius in kilometers
+        R = EARTH_RADIUS_KM
 
         lat1_rad = math.radians(self.latitude)
         lon1_rad = math.radians(self.longitude)
@@ -101,3 +118,41 @@ class Location(BaseModel):
                 v, 6
             )  # Round coordinates to 6 decimal places (~1m precision)
         }
+
+        # Parsed points are shared through the WKB cache, so they must not change
+        frozen = True
+
+
+@lru_cache(maxsize=1024)
+def _location_from_wkb_bytes(data: bytes, address: Optional[str]) -> Location:
+    """Parse a WKB/EWKB point, sharing one Location per distinct point and address"""
+    byte_order = "<" if data[0] == 1 else ">"
+    (geometry_type,) = struct.unpack_from(byte_order + "I", data, 1)
+    offset = 9 if geometry_type & _EWKB_SRID_FLAG else 5
+    longitude, latitude = struct.unpack_from(byte_order + "dd", data, offset)
+
+    return Location(latitude=latitude, longitude=longitude, address=address)
+
+
+def haversine_distances_km(
+    origin: Location, destinations: Sequence[Location]
+) -> np.ndarray:
+    """Vectorized Haversine distances in kilometers from origin to each destination"""
+    count = len(destinations)
+    latitudes = np.radians(
+        np.fromiter((d.latitude for d in destinations), dtype=np.float64, count=count)
+    )
+    longitudes = np.radians(
+        np.fromiter((d.longitude for d in destinations), dtype=np.float64, count=count)
+    )
+    origin_lat = math.radians(origin.latitude)
+    origin_lon = math.radians(origin.longitude)
+
+    dlat = latitudes - origin_lat
+    dlon = longitudes - origin_lon
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + math.cos(origin_lat) * np.cos(latitudes) * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
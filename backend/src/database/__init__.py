@@ -3,6 +3,7 @@ from .connection import (
     get_async_session,
     get_db_session,
     get_engine,
+    warm_up_pool,
 )
 from .settings import database_settings, DatabaseSettings
 
@@ -11,6 +12,7 @@ __all__ = [
     "get_async_session",
     "get_db_session",
     "get_engine",
+    "warm_up_pool",
     "database_settings",
     "DatabaseSettings",
 ]
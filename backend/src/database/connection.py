@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import (
@@ -20,7 +21,16 @@ _session_factory: async_sessionmaker[AsyncSession] | None = None
 
 def create_engine() -> AsyncEngine:
     """Create and configure async SQLAlchemy engine"""
-    return create_async_engine(database_settings.async_database_url)
+    return create_async_engine(
+        database_settings.async_database_url,
+        pool_size=database_settings.DB_POOL_SIZE,
+        max_overflow=database_settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        query_cache_size=database_settings.DB_QUERY_CACHE_SIZE,
+        connect_args={
+            "statement_cache_size": database_settings.DB_STATEMENT_CACHE_SIZE
+        },
+    )
 
 
 def get_engine() -> AsyncEngine:
@@ -31,6 +41,19 @@ def get_engine() -> AsyncEngine:
     return _engine
 
 
+async def warm_up_pool() -> None:
+    """Open pool_size connections up front so first requests skip the connect cost"""
+    engine = get_engine()
+
+    async def _open_and_release() -> None:
+        async with engine.connect():
+            pass
+
+    await asyncio.gather(
+        *(_open_and_release() for _ in range(database_settings.DB_POOL_SIZE))
+    )
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get the global session factory"""
     global _session_factory
@@ -54,6 +77,11 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
 
 # Dependency for FastAPI
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency to get database session"""
+    """
+    FastAPI dependency to get database session
+    FastAPI caches dependencies per request, so every repository built for one
+    request shares this session. The session autobegins a single transaction on
+    the first statement, committed once here when the request finishes.
+    """
     async with get_async_session() as session:
         yield session
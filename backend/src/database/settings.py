@@ -11,6 +11,12 @@ class DatabaseSettings(BaseSettings):
     DB_USER: str
     DB_PASSWORD: str
 
+    # Connection Pool Configuration
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # Set to 0 when running behind PgBouncer
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled SQL cache entries
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -11,7 +11,7 @@ from src.warehouse.warehouse_repository import WarehouseRepository
 from src.user.user_repository import UserRepository
 from src.product_record.product_record_repository import ProductRecordRepository
 from src.product_record.product_record_entity import ProductRecordStatus
-from src.base import Location
+from src.base import Location, haversine_distances_km
 from typing import List
 import math
 import asyncio
@@ -79,9 +79,11 @@ class CreateOrderUseCase:
         """Validate stock availability and reserve for concurrent safety"""
         available_records = []
 
+        # Load every requested record with its current status in one query
+        product_records = await self._product_record_repository.get_by_ids(record_ids)
+
         for record_id in record_ids:
-            # Get product record with current status
-            product_record = await self._product_record_repository.get_by_id(record_id)
+            product_record = product_records.get(record_id)
 
             if not product_record:
                 continue  # Skip if record doesn't exist
@@ -216,21 +218,19 @@ class CreateOrderUseCase:
         if not truly_available_trucks:
             return None
 
-        # Find closest truck by calculating distances
-        closest_truck = None
-        min_distance = float("inf")
-
-        for truck in truly_available_trucks:
-            if truck.current_location:
-                distance = self._calculate_distance_km(
-                    origin_location, truck.current_location
-                )
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_truck = truck
+        # Find closest truck by calculating all distances in one pass
+        located_trucks = [
+            truck for truck in truly_available_trucks if truck.current_location
+        ]
 
         # If no truck has location data, return first available
-        return closest_truck or truly_available_trucks[0]
+        if not located_trucks:
+            return truly_available_trucks[0]
+
+        distances = haversine_distances_km(
+            origin_location, [truck.current_location for truck in located_trucks]
+        )
+        return located_trucks[int(distances.argmin())]
 
     def _calculate_estimated_time(
         self, origin: Location, destination: Location
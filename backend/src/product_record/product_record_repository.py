@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, func
 from sqlalchemy.orm import joinedload
@@ -13,6 +13,8 @@ from src.product_record.product_record_entity import (
 from src.product.product_entity import ProductModel
 from src.user.user_entity import UserModel
 from src.warehouse.warehouse_entity import WarehouseModel
+from src.warehouse.warehouse_cache import nearest_warehouse_cache
+from src.base import invalidate_after_commit
 
 
 class ProductRecordRepository:
@@ -38,6 +40,8 @@ class ProductRecordRepository:
 
             self.session.add(product_record_model)
             await self.session.flush()
+            # Stored records use up warehouse capacity
+            invalidate_after_commit(self.session, nearest_warehouse_cache)
 
             created_product_record = self._model_to_entity(product_record_model)
             return created_product_record
@@ -64,6 +68,26 @@ class ProductRecordRepository:
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get product record by ID: {str(e)}")
 
+    async def get_by_ids(self, record_ids: List[int]) -> Dict[int, ProductRecord]:
+        """Get product records by ID in a single query, keyed by record ID"""
+        if not record_ids:
+            return {}
+
+        try:
+            result = await self.session.execute(
+                select(ProductRecordModel).where(
+                    ProductRecordModel.RecordID.in_(record_ids)
+                )
+            )
+
+            return {
+                model.RecordID: self._model_to_entity(model)
+                for model in result.scalars()
+            }
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get product records by IDs: {str(e)}")
+
     async def get_by_id_with_names(
         self, record_id: int
     ) -> Optional[Tuple[ProductRecord, Optional[str], Optional[str]]]:
@@ -401,15 +425,21 @@ class ProductRecordRepository:
             if not update_data_filtered:
                 return await self.get_by_id(record_id)
 
-            # Execute update
-            await self.session.execute(
+            # Execute update, reading the updated record back in the same statement
+            result = await self.session.execute(
                 update(ProductRecordModel)
                 .where(ProductRecordModel.RecordID == record_id)
                 .values(**update_data_filtered)
+                .returning(ProductRecordModel)
             )
+            updated_model = result.scalar_one_or_none()
+
+            if updated_model is None:
+                return None
 
-            # Return updated product record
-            return await self.get_by_id(record_id)
+            # Status or warehouse changes move capacity between warehouses
+            invalidate_after_commit(self.session, nearest_warehouse_cache)
+            return self._model_to_entity(updated_model)
 
         except SQLAlchemyError as e:
             await self.session.rollback()
@@ -430,6 +460,7 @@ class ProductRecordRepository:
 
             await self.session.delete(product_record_model)
             await self.session.flush()
+            invalidate_after_commit(self.session, nearest_warehouse_cache)
 
             return True
 
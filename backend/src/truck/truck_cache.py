@@ -0,0 +1,5 @@
+from src.base import TTLCache
+
+# Truck responses keyed by truck_id. Status and location change often, so
+# entries only live long enough to absorb bursts of dashboard polling.
+truck_response_cache = TTLCache(maxsize=1024, ttl=2)
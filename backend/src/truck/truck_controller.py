@@ -9,10 +9,15 @@ from src.truck.use_cases.get_truck_use_case import GetTruckUseCase
 from src.truck.use_cases.get_trucks_by_status_use_case import GetTrucksByStatusUseCase
 from src.truck.use_cases.get_trucks_by_type_use_case import GetTrucksByTypeUseCase
 from src.truck.use_cases.update_truck_status_use_case import UpdateTruckStatusUseCase
+from src.truck.use_cases.get_truck_dashboard_use_case import GetTruckDashboardUseCase
+from src.warehouse_transfer.warehouse_transfer_repository import (
+    WarehouseTransferRepository,
+)
 from src.truck.truck_dto import (
     CreateTruckDto,
     TruckResponseDto,
     CreateTruckResponseDto,
+    TruckDashboardResponseDto,
     UpdateTruckStatusDto,
     truck_to_response_dto,
 )
@@ -66,6 +71,21 @@ def get_update_truck_status_use_case(
     return UpdateTruckStatusUseCase(repo)
 
 
+def get_warehouse_transfer_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> WarehouseTransferRepository:
+    return WarehouseTransferRepository(session)
+
+
+def get_truck_dashboard_use_case(
+    truck_repo: TruckRepository = Depends(get_truck_repository),
+    transfer_repo: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
+) -> GetTruckDashboardUseCase:
+    return GetTruckDashboardUseCase(truck_repo, transfer_repo)
+
+
 @router.post(
     "/", response_model=CreateTruckResponseDto, status_code=status.HTTP_201_CREATED
 )
@@ -102,6 +122,23 @@ async def get_truck(
     return truck
 
 
+@router.get("/{truck_id}/dashboard", response_model=TruckDashboardResponseDto)
+async def get_truck_dashboard(
+    truck_id: int,
+    get_truck_dashboard_use_case: GetTruckDashboardUseCase = Depends(
+        get_truck_dashboard_use_case
+    ),
+) -> TruckDashboardResponseDto:
+    """Get a truck and its warehouse transfers in a single request"""
+    dashboard = await get_truck_dashboard_use_case.execute(truck_id)
+    if not dashboard:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Truck with ID {truck_id} not found",
+        )
+    return dashboard
+
+
 @router.get("/", response_model=List[TruckResponseDto])
 async def get_all_trucks(
     get_truck_use_case: GetTruckUseCase = Depends(get_get_truck_use_case),
@@ -1,7 +1,8 @@
 from pydantic import BaseModel
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from src.truck.truck_entity import TruckStatus, TruckType
 from src.base import Location
+from src.warehouse_transfer.warehouse_transfer_dto import WarehouseTransferResponseDto
 
 if TYPE_CHECKING:
     from src.truck.truck_entity import Truck
@@ -37,9 +38,14 @@ class CreateTruckResponseDto(BaseModel):
     message: str
 
 
+class TruckDashboardResponseDto(BaseModel):
+    truck: TruckResponseDto
+    transfers: List[WarehouseTransferResponseDto]
+
+
 def truck_to_response_dto(truck: "Truck") -> TruckResponseDto:
     """Convert Truck entity to TruckResponseDto"""
-    return TruckResponseDto(
+    return TruckResponseDto.model_construct(
         truck_id=truck.truck_id,
         truck_driver_id=truck.truck_driver_id,
         current_location=truck.current_location,
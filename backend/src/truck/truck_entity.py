@@ -17,7 +17,7 @@ class TruckType(str, Enum):
     NORMAL = "Normal"
 
 
-@dataclass
+@dataclass(slots=True)
 class Truck:
     truck_id: Optional[int]
     truck_driver_id: Optional[int]
@@ -27,23 +27,11 @@ class Truck:
     load_capacity_kg: Optional[int]
 
     def __post_init__(self):
-        if isinstance(self.status, str):
+        if not isinstance(self.status, TruckStatus):
             self.status = TruckStatus(self.status)
-        if isinstance(self.type, str):
+        if not isinstance(self.type, TruckType):
             self.type = TruckType(self.type)
 
-        # Validate that the status is one of the allowed values
-        if self.status not in TruckStatus:
-            raise ValueError(
-                f"Invalid status: {self.status}. Must be one of {list(TruckStatus)}"
-            )
-
-        # Validate that the type is one of the allowed values
-        if self.type not in TruckType:
-            raise ValueError(
-                f"Invalid type: {self.type}. Must be one of {list(TruckType)}"
-            )
-
 
 class TruckModel(Base):
     """SQLAlchemy Truck model for PostgreSQL with PostGIS"""
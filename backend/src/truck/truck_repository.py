@@ -1,11 +1,26 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, lambda_stmt
 from sqlalchemy.exc import SQLAlchemyError
 from geoalchemy2.functions import ST_DWithin
 from sqlalchemy import func, text
 from src.truck.truck_entity import Truck, TruckStatus, TruckType, TruckModel
-from src.base import Location
+from src.truck.truck_cache import truck_response_cache
+from src.base import Location, invalidate_after_commit
+
+# Value -> member lookups, cheaper than calling the Enum constructor per row
+_TRUCK_STATUS_BY_VALUE = {status.value: status for status in TruckStatus}
+_TRUCK_TYPE_BY_VALUE = {truck_type.value: truck_type for truck_type in TruckType}
+
+# Base truck SELECT as a lambda statement, so the hot lookups below are compiled
+# once per process and only their bound parameters change between calls
+_SELECT_TRUCKS = lambda_stmt(
+    lambda: select(
+        TruckModel,
+        func.ST_X(text("currentlocation::geometry")).label("longitude"),
+        func.ST_Y(text("currentlocation::geometry")).label("latitude"),
+    )
+)
 
 
 class TruckRepository:
@@ -32,18 +47,13 @@ class TruckRepository:
             return created_truck
 
         except SQLAlchemyError as e:
-            await self.session.rollback()
             raise Exception(f"Failed to create truck: {str(e)}")
 
     async def get_by_id(self, truck_id: int) -> Optional[Truck]:
         """Get truck by ID"""
         try:
             result = await self.session.execute(
-                select(
-                    TruckModel,
-                    func.ST_X(text("currentlocation::geometry")).label("longitude"),
-                    func.ST_Y(text("currentlocation::geometry")).label("latitude"),
-                ).where(TruckModel.TruckID == truck_id)
+                _SELECT_TRUCKS + (lambda s: s.where(TruckModel.TruckID == truck_id))
             )
             row = result.first()
 
@@ -65,9 +75,8 @@ class TruckRepository:
                     func.ST_Y(text("currentlocation::geometry")).label("latitude"),
                 )
             )
-            rows = result.all()
 
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get all trucks: {str(e)}")
@@ -75,16 +84,12 @@ class TruckRepository:
     async def get_by_status(self, status: TruckStatus) -> List[Truck]:
         """Get trucks by status"""
         try:
+            status_value = status.value
             result = await self.session.execute(
-                select(
-                    TruckModel,
-                    func.ST_X(text("currentlocation::geometry")).label("longitude"),
-                    func.ST_Y(text("currentlocation::geometry")).label("latitude"),
-                ).where(TruckModel.Status == status.value)
+                _SELECT_TRUCKS + (lambda s: s.where(TruckModel.Status == status_value))
             )
-            rows = result.all()
 
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get trucks by status: {str(e)}")
@@ -92,16 +97,12 @@ class TruckRepository:
     async def get_by_type(self, truck_type: TruckType) -> List[Truck]:
         """Get trucks by type"""
         try:
+            type_value = truck_type.value
             result = await self.session.execute(
-                select(
-                    TruckModel,
-                    func.ST_X(text("currentlocation::geometry")).label("longitude"),
-                    func.ST_Y(text("currentlocation::geometry")).label("latitude"),
-                ).where(TruckModel.Type == truck_type.value)
+                _SELECT_TRUCKS + (lambda s: s.where(TruckModel.Type == type_value))
             )
-            rows = result.all()
 
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get trucks by type: {str(e)}")
@@ -110,11 +111,8 @@ class TruckRepository:
         """Get trucks assigned to a specific driver"""
         try:
             result = await self.session.execute(
-                select(
-                    TruckModel,
-                    func.ST_X(text("currentlocation::geometry")).label("longitude"),
-                    func.ST_Y(text("currentlocation::geometry")).label("latitude"),
-                ).where(TruckModel.TruckDriverID == driver_id)
+                _SELECT_TRUCKS
+                + (lambda s: s.where(TruckModel.TruckDriverID == driver_id))
             )
             rows = result.all()
 
@@ -158,18 +156,50 @@ class TruckRepository:
             if location is not None:
                 update_values["CurrentLocation"] = location.to_postgis_geography()
 
-            # Execute update
-            await self.session.execute(
+            # Execute update, reading the updated truck back in the same statement
+            result = await self.session.execute(
                 update(TruckModel)
                 .where(TruckModel.TruckID == truck_id)
                 .values(**update_values)
+                .returning(
+                    TruckModel.TruckID,
+                    TruckModel.TruckDriverID,
+                    TruckModel.CurrentLocation,
+                    TruckModel.Status,
+                    TruckModel.Type,
+                    TruckModel.LoadCapacityKg,
+                )
+            )
+            row = result.first()
+            invalidate_after_commit(self.session, truck_response_cache, truck_id)
+
+            if not row:
+                return None
+
+            return self._model_to_entity(row, Location.from_wkb(row.CurrentLocation))
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to update truck status: {str(e)}")
+
+    async def set_status_if_changed(self, truck_id: int, status: TruckStatus) -> bool:
+        """Set truck status unless it already has it; returns whether a row changed"""
+        try:
+            # Trucks already in the target status match no row, so they are
+            # neither locked nor rewritten
+            result = await self.session.execute(
+                update(TruckModel)
+                .where(TruckModel.TruckID == truck_id)
+                .where(TruckModel.Status != status.value)
+                .values(Status=status.value)
             )
 
-            # Return updated truck
-            return await self.get_by_id(truck_id)
+            if result.rowcount == 0:
+                return False
+
+            invalidate_after_commit(self.session, truck_response_cache, truck_id)
+            return True
 
         except SQLAlchemyError as e:
-            await self.session.rollback()
             raise Exception(f"Failed to update truck status: {str(e)}")
 
     def _row_to_entity(self, row) -> Truck:
@@ -181,8 +211,8 @@ class TruckRepository:
             truck_id=truck_model.TruckID,
             truck_driver_id=truck_model.TruckDriverID,
             current_location=location,
-            status=TruckStatus(truck_model.Status),
-            type=TruckType(truck_model.Type),
+            status=_TRUCK_STATUS_BY_VALUE[truck_model.Status],
+            type=_TRUCK_TYPE_BY_VALUE[truck_model.Type],
             load_capacity_kg=truck_model.LoadCapacityKg,
         )
 
@@ -194,7 +224,7 @@ class TruckRepository:
             truck_id=truck_model.TruckID,
             truck_driver_id=truck_model.TruckDriverID,
             current_location=location,
-            status=TruckStatus(truck_model.Status),
-            type=TruckType(truck_model.Type),
+            status=_TRUCK_STATUS_BY_VALUE[truck_model.Status],
+            type=_TRUCK_TYPE_BY_VALUE[truck_model.Type],
             load_capacity_kg=truck_model.LoadCapacityKg,
         )
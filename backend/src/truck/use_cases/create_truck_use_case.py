@@ -15,16 +15,17 @@ class CreateTruckUseCase:
     async def execute(self, create_truck_dto: CreateTruckDto) -> CreateTruckResponseDto:
         """Create a new truck"""
 
-        driver = await self._user_repository.get_by_id(create_truck_dto.truck_driver_id)
-        if not driver:
+        # Driver lookup and existing-truck check in a single query
+        driver_with_flag = await self._user_repository.get_with_truck_flag(
+            create_truck_dto.truck_driver_id
+        )
+        if not driver_with_flag:
             raise ValueError(
                 f"Driver with ID {create_truck_dto.truck_driver_id} not found"
             )
 
-        existing_trucks = await self._truck_repository.get_by_driver_id(
-            create_truck_dto.truck_driver_id
-        )
-        if existing_trucks:
+        _, has_truck = driver_with_flag
+        if has_truck:
             raise ValueError("Driver already has a truck assigned")
 
         truck = Truck(
@@ -0,0 +1,36 @@
+from typing import Optional
+from src.truck.truck_repository import TruckRepository
+from src.truck.truck_dto import TruckDashboardResponseDto, truck_to_response_dto
+from src.warehouse_transfer.warehouse_transfer_repository import (
+    WarehouseTransferRepository,
+)
+from src.warehouse_transfer.warehouse_transfer_dto import (
+    warehouse_transfer_to_response_dto,
+)
+
+
+class GetTruckDashboardUseCase:
+    def __init__(
+        self,
+        truck_repository: TruckRepository,
+        transfer_repository: WarehouseTransferRepository,
+    ):
+        self._truck_repository = truck_repository
+        self._transfer_repository = transfer_repository
+
+    async def execute(self, truck_id: int) -> Optional[TruckDashboardResponseDto]:
+        """Get a truck together with the warehouse transfers assigned to it"""
+        # Both repositories share the request session, which cannot run two
+        # statements at once, so the queries are awaited one after the other
+        truck = await self._truck_repository.get_by_id(truck_id)
+        if not truck:
+            return None
+
+        transfers = await self._transfer_repository.get_by_truck_id(truck_id)
+
+        return TruckDashboardResponseDto(
+            truck=truck_to_response_dto(truck),
+            transfers=[
+                warehouse_transfer_to_response_dto(transfer) for transfer in transfers
+            ],
+        )
@@ -1,5 +1,6 @@
 from typing import List, Optional
 from src.truck.truck_repository import TruckRepository
+from src.truck.truck_cache import truck_response_cache
 from src.truck.truck_dto import TruckResponseDto, truck_to_response_dto
 
 
@@ -9,10 +10,17 @@ class GetTruckUseCase:
 
     async def execute_by_id(self, truck_id: int) -> Optional[TruckResponseDto]:
         """Get truck by ID"""
+        cached_truck = truck_response_cache.get(truck_id)
+        if cached_truck is not None:
+            return cached_truck
+
         truck = await self._truck_repository.get_by_id(truck_id)
         if not truck:
             return None
-        return truck_to_response_dto(truck)
+
+        truck_dto = truck_to_response_dto(truck)
+        truck_response_cache.set(truck_id, truck_dto)
+        return truck_dto
 
     async def execute_all(self) -> List[TruckResponseDto]:
         """Get all trucks"""
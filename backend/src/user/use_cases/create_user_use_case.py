@@ -3,6 +3,9 @@ from src.base import Location
 from src.user.user_repository import UserRepository
 from src.user.user_dto import CreateUserDto, CreateUserResponseDto
 
+# Roles that never have a location stored
+_ROLES_WITHOUT_LOCATION = frozenset({UserRole.ADMINISTRATOR, UserRole.TRUCK_DRIVER})
+
 
 class CreateUserUseCase:
     def __init__(self, user_repository: UserRepository):
@@ -13,7 +16,7 @@ class CreateUserUseCase:
         # Set location to None for administrators and truck drivers
         location = (
             None
-            if create_user_dto.role in [UserRole.ADMINISTRATOR, UserRole.TRUCK_DRIVER]
+            if create_user_dto.role in _ROLES_WITHOUT_LOCATION
             else create_user_dto.location
         )
 
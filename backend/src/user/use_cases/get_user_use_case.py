@@ -1,6 +1,8 @@
 from typing import List, Optional
 from src.user.user_repository import UserRepository
-from src.user.user_dto import UserResponseDto, user_to_response_dto
+from src.user.user_cache import user_response_cache
+from src.user.user_entity import UserRole
+from src.user.user_dto import UserResponseDto, UserListItemDto, user_to_response_dto
 
 
 class GetUserUseCase:
@@ -9,12 +11,29 @@ class GetUserUseCase:
 
     async def execute_by_id(self, user_id: int) -> Optional[UserResponseDto]:
         """Get user by ID"""
+        cached_user = user_response_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
+
         user = await self._user_repository.get_by_id(user_id)
         if not user:
             return None
-        return user_to_response_dto(user)
+
+        user_dto = user_to_response_dto(user)
+        user_response_cache.set(user_id, user_dto)
+        return user_dto
 
     async def execute_all(self) -> List[UserResponseDto]:
         """Get all users"""
         users = await self._user_repository.get_all()
         return [user_to_response_dto(user) for user in users]
+
+    async def execute_all_minimal(
+        self, role: Optional[UserRole] = None
+    ) -> List[UserListItemDto]:
+        """Get id, name and role of all users, optionally filtered by role"""
+        users = await self._user_repository.get_all_minimal(role)
+        return [
+            UserListItemDto(user_id=user_id, name=name, role=user_role)
+            for user_id, name, user_role in users
+        ]
@@ -1,7 +1,18 @@
+import hashlib
+import hmac
 from typing import Optional
+from src.base import TTLCache
 from src.user.user_repository import UserRepository
 from src.user.user_dto import LoginRequestDto, LoginResponseDto
 
+# Successful logins keyed by (email, password digest), so repeated logins from
+# the same client skip the database for a short while
+_login_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _login_cache_key(email: str, password: str) -> tuple:
+    return email, hashlib.blake2b(password.encode(), digest_size=16).digest()
+
 
 class LoginUserUseCase:
     def __init__(self, user_repository: UserRepository):
@@ -12,16 +23,32 @@ class LoginUserUseCase:
         Authenticate user with email and password
         Returns user_id and role if successful, None if authentication fails
         """
-        user = await self.user_repository.get_by_email_and_password(
-            login_dto.email, login_dto.password
+        cache_key = _login_cache_key(login_dto.email, login_dto.password)
+        cached_response = _login_cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Look up by the indexed contact info only and compare passwords here in
+        # constant time, rather than matching the password inside the query
+        candidates = await self.user_repository.get_by_email(login_dto.email)
+        password = login_dto.password.encode()
+        user = next(
+            (
+                candidate
+                for candidate in candidates
+                if hmac.compare_digest(candidate.password_string.encode(), password)
+            ),
+            None,
         )
 
         if not user:
             return None
 
-        return LoginResponseDto(
+        response = LoginResponseDto(
             user_id=user.user_id,
             role=user.role,
             name=user.name,
             message="Login successful",
         )
+        _login_cache.set(cache_key, response)
+        return response
@@ -0,0 +1,4 @@
+from src.base import TTLCache
+
+# User responses keyed by user_id
+user_response_cache = TTLCache(maxsize=1024, ttl=30)
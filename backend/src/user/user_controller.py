@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.user.user_entity import UserRole
 from src.user.user_repository import UserRepository
@@ -10,6 +10,7 @@ from src.user.use_cases.login_user_use_case import LoginUserUseCase
 from src.user.user_dto import (
     CreateUserDto,
     UserResponseDto,
+    UserListItemDto,
     CreateUserResponseDto,
     LoginRequestDto,
     LoginResponseDto,
@@ -66,6 +67,15 @@ async def create_user(
         )
 
 
+@router.get("/list", response_model=List[UserListItemDto])
+async def get_user_list(
+    role: Optional[UserRole] = None,
+    get_user_use_case: GetUserUseCase = Depends(get_get_user_use_case),
+) -> List[UserListItemDto]:
+    """Get id, name and role of all users, without contact info or location"""
+    return await get_user_use_case.execute_all_minimal(role)
+
+
 @router.get("/{user_id}", response_model=UserResponseDto)
 async def get_user(
     user_id: int, get_user_use_case: GetUserUseCase = Depends(get_get_user_use_case)
@@ -26,6 +26,12 @@ class UserResponseDto(BaseModel):
         from_attributes = True
 
 
+class UserListItemDto(BaseModel):
+    user_id: int
+    name: str
+    role: UserRole
+
+
 class CreateUserResponseDto(BaseModel):
     user_id: int
     message: str
@@ -44,8 +50,8 @@ class LoginResponseDto(BaseModel):
 
 
 def user_to_response_dto(user: "User") -> UserResponseDto:
-    """Convert User entity to UserResponseDto"""
-    return UserResponseDto(
+    """Convert User entity to UserResponseDto without re-validating entity fields"""
+    return UserResponseDto.model_construct(
         user_id=user.user_id,
         name=user.name,
         contact_info=user.contact_info,
@@ -14,7 +14,7 @@ class UserRole(str, Enum):
     TRUCK_DRIVER = "TruckDriver"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     user_id: Optional[int]
     name: str
@@ -24,12 +24,8 @@ class User:
     role: UserRole
 
     def __post_init__(self):
-        if isinstance(self.role, str):
+        if not isinstance(self.role, UserRole):
             self.role = UserRole(self.role)
-        if self.role not in UserRole:
-            raise ValueError(
-                f"Invalid role: {self.role}. Must be one of {list(UserRole)}"
-            )
 
 
 class UserModel(Base):
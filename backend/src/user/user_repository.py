@@ -1,12 +1,29 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
 from geoalchemy2.functions import ST_GeogFromText, ST_DWithin
-from sqlalchemy import func, text
 from src.user.user_entity import User, UserRole, UserModel
+from src.truck.truck_entity import TruckModel
 from src.base import Location
 
+# Value -> member lookup, cheaper than calling the Enum constructor per row
+_USER_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
+# Plain columns for user lookups, so rows skip ORM instance hydration
+_USER_COLUMNS = (
+    UserModel.UserID,
+    UserModel.Name,
+    UserModel.ContactInfo,
+    UserModel.Location,
+    UserModel.Address,
+    UserModel.PasswordString,
+    UserModel.Role,
+)
+
+# Lambda statement so the hot lookups below reuse their compiled SQL between calls
+_SELECT_USERS = lambda_stmt(lambda: select(*_USER_COLUMNS))
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
@@ -48,12 +65,7 @@ class UserRepository:
         """Get user by ID"""
         try:
             result = await self.session.execute(
-                select(
-                    UserModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                    UserModel.Address.label("address"),
-                ).where(UserModel.UserID == user_id)
+                _SELECT_USERS + (lambda s: s.where(UserModel.UserID == user_id))
             )
             row = result.first()
 
@@ -69,20 +81,37 @@ class UserRepository:
     # --------------------------------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------------------------------
 
-    async def get_all(self) -> List[User]:
-        """Get all users"""
+    async def get_with_truck_flag(self, user_id: int) -> Optional[Tuple[User, bool]]:
+        """Get user by ID together with whether a truck is assigned to them"""
         try:
             result = await self.session.execute(
                 select(
-                    UserModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                    UserModel.Address.label("address"),
-                )
+                    *_USER_COLUMNS,
+                    exists()
+                    .where(TruckModel.TruckDriverID == UserModel.UserID)
+                    .label("has_truck"),
+                ).where(UserModel.UserID == user_id)
             )
-            rows = result.all()
+            row = result.first()
 
-            return [self._row_to_entity(row) for row in rows]
+            if not row:
+                return None
+
+            return self._row_to_entity(row), row.has_truck
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get user with truck flag: {str(e)}")
+
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+
+    async def get_all(self) -> List[User]:
+        """Get all users"""
+        try:
+            result = await self.session.execute(select(*_USER_COLUMNS))
+
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get all users: {str(e)}")
@@ -94,17 +123,12 @@ class UserRepository:
     async def get_by_role(self, role: UserRole) -> List[User]:
         """Get users by role"""
         try:
+            role_value = role.value
             result = await self.session.execute(
-                select(
-                    UserModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                    UserModel.Address.label("address"),
-                ).where(UserModel.Role == role.value)
+                _SELECT_USERS + (lambda s: s.where(UserModel.Role == role_value))
             )
-            rows = result.all()
 
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get users by role: {str(e)}")
@@ -113,18 +137,36 @@ class UserRepository:
     # --------------------------------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------------------------------
 
+    async def get_all_minimal(
+        self, role: Optional[UserRole] = None
+    ) -> List[Tuple[int, str, UserRole]]:
+        """Get (user_id, name, role) for all users, optionally filtered by role"""
+        try:
+            stmt = select(UserModel.UserID, UserModel.Name, UserModel.Role)
+            if role is not None:
+                stmt = stmt.where(UserModel.Role == role.value)
+
+            result = await self.session.execute(stmt)
+
+            return [
+                (row.UserID, row.Name, _USER_ROLE_BY_VALUE[row.Role])
+                for row in result
+            ]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get minimal user list: {str(e)}")
+
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+    # --------------------------------------------------------------------------------------------------------------------------------------------------
+
     async def get_users_within_distance(
         self, center: Location, distance_meters: float
     ) -> List[User]:
         """Get users within a certain distance from a center point"""
         try:
             result = await self.session.execute(
-                select(
-                    UserModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                    UserModel.Address.label("address"),
-                ).where(
+                select(*_USER_COLUMNS).where(
                     ST_DWithin(
                         UserModel.Location,
                         center.to_postgis_geography(),
@@ -143,47 +185,31 @@ class UserRepository:
     # --------------------------------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------------------------------
 
-    async def get_by_email_and_password(
-        self, email: str, password: str
-    ) -> Optional[User]:
-        """Get user by email (contact_info) and password for login"""
+    async def get_by_email(self, email: str) -> List[User]:
+        """Get users by email (contact_info); contact info is not unique"""
         try:
             result = await self.session.execute(
-                select(
-                    UserModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                    UserModel.Address.label("address"),
-                ).where(
-                    UserModel.ContactInfo == email, UserModel.PasswordString == password
-                )
+                _SELECT_USERS + (lambda s: s.where(UserModel.ContactInfo == email))
             )
-            row = result.first()
 
-            if not row:
-                return None
-
-            return self._row_to_entity(row)
+            return [self._row_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
-            raise Exception(f"Failed to authenticate user: {str(e)}")
+            raise Exception(f"Failed to get users by email: {str(e)}")
 
     # --------------------------------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------------------------------
 
     def _row_to_entity(self, row) -> User:
-        """Convert SQLAlchemy row to domain entity"""
-        user_model = row[0]
-        location = Location.from_db_row(row)
-
+        """Convert a _USER_COLUMNS row to domain entity"""
         return User(
-            user_id=user_model.UserID,
-            name=user_model.Name,
-            contact_info=user_model.ContactInfo,
-            location=location,
-            password_string=user_model.PasswordString,
-            role=UserRole(user_model.Role),
+            user_id=row.UserID,
+            name=row.Name,
+            contact_info=row.ContactInfo,
+            location=Location.from_wkb(row.Location, row.Address),
+            password_string=row.PasswordString,
+            role=_USER_ROLE_BY_VALUE[row.Role],
         )
 
     # --------------------------------------------------------------------------------------------------------------------------------------------------
@@ -200,5 +226,5 @@ class UserRepository:
             contact_info=user_model.ContactInfo,
             location=location,
             password_string=user_model.PasswordString,
-            role=UserRole(user_model.Role),
+            role=_USER_ROLE_BY_VALUE[user_model.Role],
         )
@@ -13,41 +13,33 @@ class GetWarehouseUseCase:
 
     async def execute_by_id(self, warehouse_id: int) -> Optional[WarehouseResponseDto]:
         """Get warehouse by ID"""
-        warehouse = await self._warehouse_repository.get_by_id(warehouse_id)
-        if not warehouse:
+        warehouse_with_products = (
+            await self._warehouse_repository.get_by_id_with_products(warehouse_id)
+        )
+        if not warehouse_with_products:
             return None
 
-        # Get products in storage for this warehouse
-        products_data = await self._warehouse_repository.get_products_in_storage(
-            warehouse_id
-        )
+        warehouse, products_data = warehouse_with_products
         products_in_storage = [
             ProductInStorageDto(**product_data) for product_data in products_data
         ]
 
-        # Convert to response DTO and add products
-        warehouse_dto = warehouse_to_response_dto(warehouse)
-        warehouse_dto.products_in_storage = products_in_storage
-
-        return warehouse_dto
+        return warehouse_to_response_dto(warehouse, products_in_storage)
 
     async def execute_all(self) -> List[WarehouseResponseDto]:
         """Get all warehouses"""
-        warehouses = await self._warehouse_repository.get_all()
+        warehouses_with_products = (
+            await self._warehouse_repository.get_all_with_products()
+        )
         result_warehouses = []
 
-        for warehouse in warehouses:
-            # Get products in storage for each warehouse
-            products_data = await self._warehouse_repository.get_products_in_storage(
-                warehouse.warehouse_id
-            )
+        for warehouse, products_data in warehouses_with_products:
             products_in_storage = [
                 ProductInStorageDto(**product_data) for product_data in products_data
             ]
 
-            # Convert to response DTO and add products
-            warehouse_dto = warehouse_to_response_dto(warehouse)
-            warehouse_dto.products_in_storage = products_in_storage
-            result_warehouses.append(warehouse_dto)
+            result_warehouses.append(
+                warehouse_to_response_dto(warehouse, products_in_storage)
+            )
 
         return result_warehouses
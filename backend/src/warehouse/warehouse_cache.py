@@ -0,0 +1,6 @@
+from src.base import TTLCache
+
+# Nearest suitable warehouse keyed by (rounded supplier location, refrigeration,
+# quantity). Free capacity changes whenever product records are created, updated
+# or deleted, so ProductRecordRepository clears it on every such write.
+nearest_warehouse_cache = TTLCache(maxsize=2048, ttl=30)
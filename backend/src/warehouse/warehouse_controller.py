@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Header
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Request
+from pydantic import TypeAdapter
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.warehouse.warehouse_repository import WarehouseRepository
@@ -11,11 +12,16 @@ from src.warehouse.warehouse_dto import (
     CreateWarehouseResponseDto,
     warehouse_to_response_dto,
 )
+from src.base import etag_json_response
 from src.database import get_db_session
 
 # Create router
 router = APIRouter(prefix="/warehouses", tags=["warehouses"])
 
+# Serializers for the read endpoints, which carry every product in storage
+_warehouse_adapter = TypeAdapter(WarehouseResponseDto)
+_warehouse_list_adapter = TypeAdapter(List[WarehouseResponseDto])
+
 
 # Dependencies
 def get_warehouse_repository(
@@ -65,8 +71,9 @@ async def create_warehouse(
 @router.get("/{warehouse_id}", response_model=WarehouseResponseDto)
 async def get_warehouse(
     warehouse_id: int,
+    request: Request,
     get_warehouse_use_case: GetWarehouseUseCase = Depends(get_get_warehouse_use_case),
-) -> WarehouseResponseDto:
+):
     """Get warehouse by ID"""
     warehouse = await get_warehouse_use_case.execute_by_id(warehouse_id)
     if not warehouse:
@@ -74,12 +81,15 @@ async def get_warehouse(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Warehouse with ID {warehouse_id} not found",
         )
-    return warehouse
+    return etag_json_response(request, _warehouse_adapter, warehouse)
 
 
 @router.get("/", response_model=List[WarehouseResponseDto])
 async def get_all_warehouses(
+    request: Request,
     get_warehouse_use_case: GetWarehouseUseCase = Depends(get_get_warehouse_use_case),
-) -> List[WarehouseResponseDto]:
+):
     """Get all warehouses"""
-    return await get_warehouse_use_case.execute_all()
+    return etag_json_response(
+        request, _warehouse_list_adapter, await get_warehouse_use_case.execute_all()
+    )
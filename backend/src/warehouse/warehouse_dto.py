@@ -52,12 +52,16 @@ class CreateWarehouseResponseDto(BaseModel):
     message: str
 
 
-def warehouse_to_response_dto(warehouse: "Warehouse") -> WarehouseResponseDto:
-    """Convert Warehouse entity to WarehouseResponseDto"""
-    return WarehouseResponseDto(
+def warehouse_to_response_dto(
+    warehouse: "Warehouse",
+    products_in_storage: Optional[List[ProductInStorageDto]] = None,
+) -> WarehouseResponseDto:
+    """Convert Warehouse entity to WarehouseResponseDto without re-validating entity fields"""
+    return WarehouseResponseDto.model_construct(
         warehouse_id=warehouse.warehouse_id,
         name=warehouse.name,
         location=warehouse.location,
         normal_capacity_kg=warehouse.normal_capacity_kg,
         refrigerated_capacity_kg=warehouse.refrigerated_capacity_kg,
+        products_in_storage=products_in_storage or [],
     )
@@ -6,7 +6,7 @@ from src.database import Base
 from src.base import Location
 
 
-@dataclass
+@dataclass(slots=True)
 class Warehouse:
     warehouse_id: Optional[int]
     name: str
@@ -1,13 +1,24 @@
-from typing import List, Optional, Dict, Any
+from dataclasses import replace
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, and_
 from sqlalchemy.exc import SQLAlchemyError
 from geoalchemy2.functions import ST_DWithin, ST_Distance
-from sqlalchemy import func, text
+from sqlalchemy import text
 from src.warehouse.warehouse_entity import Warehouse, WarehouseModel
-from src.base import Location
+from src.base import Location, invalidate_after_commit
 from src.product_record.product_record_entity import ProductRecordModel
 from src.product.product_entity import ProductModel
+from src.warehouse.warehouse_cache import nearest_warehouse_cache
+
+# Plain columns for warehouse lookups, so rows skip ORM instance hydration
+_WAREHOUSE_COLUMNS = (
+    WarehouseModel.WarehouseID,
+    WarehouseModel.Name,
+    WarehouseModel.Location,
+    WarehouseModel.NormalCapacityKg,
+    WarehouseModel.RefrigeratedCapacityKg,
+)
 
 
 class WarehouseRepository:
@@ -26,6 +37,7 @@ class WarehouseRepository:
 
             self.session.add(warehouse_model)
             await self.session.flush()
+            invalidate_after_commit(self.session, nearest_warehouse_cache)
 
             created_warehouse = self._model_to_entity(
                 warehouse_model, warehouse.name, warehouse.location
@@ -40,11 +52,9 @@ class WarehouseRepository:
         """Get warehouse by ID"""
         try:
             result = await self.session.execute(
-                select(
-                    WarehouseModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                ).where(WarehouseModel.WarehouseID == warehouse_id)
+                select(*_WAREHOUSE_COLUMNS).where(
+                    WarehouseModel.WarehouseID == warehouse_id
+                )
             )
             row = result.first()
 
@@ -56,18 +66,28 @@ class WarehouseRepository:
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get warehouse by ID: {str(e)}")
 
-    async def get_all(self) -> List[Warehouse]:
-        """Get all warehouses"""
+    async def get_by_ids(self, warehouse_ids: List[int]) -> Dict[int, Warehouse]:
+        """Get warehouses by ID in a single query, keyed by warehouse ID"""
         try:
             result = await self.session.execute(
-                select(
-                    WarehouseModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
+                select(*_WAREHOUSE_COLUMNS).where(
+                    WarehouseModel.WarehouseID.in_(warehouse_ids)
                 )
             )
             rows = result.all()
 
+            warehouses = [self._row_to_entity(row) for row in rows]
+            return {warehouse.warehouse_id: warehouse for warehouse in warehouses}
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get warehouses by IDs: {str(e)}")
+
+    async def get_all(self) -> List[Warehouse]:
+        """Get all warehouses"""
+        try:
+            result = await self.session.execute(select(*_WAREHOUSE_COLUMNS))
+            rows = result.all()
+
             return [self._row_to_entity(row) for row in rows]
 
         except SQLAlchemyError as e:
@@ -79,11 +99,7 @@ class WarehouseRepository:
         """Get warehouses within a certain distance from a center point"""
         try:
             result = await self.session.execute(
-                select(
-                    WarehouseModel,
-                    func.ST_X(text("location::geometry")).label("longitude"),
-                    func.ST_Y(text("location::geometry")).label("latitude"),
-                ).where(
+                select(*_WAREHOUSE_COLUMNS).where(
                     ST_DWithin(
                         WarehouseModel.Location,
                         center.to_postgis_geography(),
@@ -99,16 +115,13 @@ class WarehouseRepository:
             raise Exception(f"Failed to get warehouses within distance: {str(e)}")
 
     def _row_to_entity(self, row) -> Warehouse:
-        """Convert SQLAlchemy row to domain entity"""
-        warehouse_model = row[0]
-        location = Location.from_db_row(row)
-
+        """Convert a _WAREHOUSE_COLUMNS row to domain entity"""
         return Warehouse(
-            warehouse_id=warehouse_model.WarehouseID,
-            name=warehouse_model.Name,
-            location=location,
-            normal_capacity_kg=warehouse_model.NormalCapacityKg,
-            refrigerated_capacity_kg=warehouse_model.RefrigeratedCapacityKg,
+            warehouse_id=row.WarehouseID,
+            name=row.Name,
+            location=Location.from_wkb(row.Location),
+            normal_capacity_kg=row.NormalCapacityKg,
+            refrigerated_capacity_kg=row.RefrigeratedCapacityKg,
         )
 
     async def find_nearest_suitable_warehouse(
@@ -118,38 +131,47 @@ class WarehouseRepository:
         quantity_kg: int,
     ) -> Optional[Warehouse]:
         """Find the nearest warehouse with enough capacity for the product."""
+        # ~1km grid, so suppliers clustered in one area share the lookup
+        cache_key = (
+            round(supplier_location.latitude, 2),
+            round(supplier_location.longitude, 2),
+            requires_refrigeration,
+            quantity_kg,
+        )
+        cached_warehouse = nearest_warehouse_cache.get(cache_key)
+        if cached_warehouse is not None:
+            # Copy, so callers never share (or change) the cached instance
+            return replace(cached_warehouse)
+
         try:
-            # Query warehouses ordered by distance with current usage
+            # Query warehouses ordered by distance with current usage, summing
+            # only the storage side (normal or refrigerated) the product needs.
+            # The KNN <-> ordering walks the location GiST index nearest-first.
             query = text("""
                 WITH warehouse_usage AS (
-                    SELECT 
-                        w.warehouseid,
-                        w.name,
-                        w.location,
-                        w.normalcapacitykg,
-                        w.refrigeratedcapacitykg,
-                        COALESCE(SUM(CASE WHEN NOT p.requiresrefrigeration THEN pr.quantitykg ELSE 0 END), 0) as normal_used,
-                        COALESCE(SUM(CASE WHEN p.requiresrefrigeration THEN pr.quantitykg ELSE 0 END), 0) as refrigerated_used,
-                        ST_Distance(w.location, ST_GeogFromText(:supplier_location)) as distance
-                    FROM warehouse w
-                    LEFT JOIN productrecord pr ON w.warehouseid = pr.warehouseid AND pr.status = 'InStock'
-                    LEFT JOIN product p ON pr.productid = p.productid
-                    GROUP BY w.warehouseid, w.name, w.location, w.normalcapacitykg, w.refrigeratedcapacitykg
+                    SELECT
+                        pr.warehouseid,
+                        SUM(pr.quantitykg) as used
+                    FROM productrecord pr
+                    JOIN product p ON pr.productid = p.productid
+                    WHERE pr.status = 'InStock'
+                    AND p.requiresrefrigeration = :requires_refrigeration
+                    GROUP BY pr.warehouseid
                 )
-                SELECT 
-                    warehouseid,
-                    name,
-                    ST_X(location::geometry) as longitude,
-                    ST_Y(location::geometry) as latitude,
-                    normalcapacitykg,
-                    refrigeratedcapacitykg,
-                    normal_used,
-                    refrigerated_used,
-                    distance
-                FROM warehouse_usage
-                WHERE (:requires_refrigeration = false OR (refrigeratedcapacitykg > 0 AND refrigeratedcapacitykg - refrigerated_used >= :quantity_kg))
-                AND (:requires_refrigeration = true OR normalcapacitykg - normal_used >= :quantity_kg)
-                ORDER BY distance
+                SELECT
+                    w.warehouseid,
+                    w.name,
+                    ST_X(w.location::geometry) as longitude,
+                    ST_Y(w.location::geometry) as latitude,
+                    w.normalcapacitykg,
+                    w.refrigeratedcapacitykg,
+                    COALESCE(u.used, 0) as used,
+                    ST_Distance(w.location, ST_GeogFromText(:supplier_location)) as distance
+                FROM warehouse w
+                LEFT JOIN warehouse_usage u ON w.warehouseid = u.warehouseid
+                WHERE (:requires_refrigeration = false OR w.refrigeratedcapacitykg > 0)
+                AND (CASE WHEN :requires_refrigeration THEN w.refrigeratedcapacitykg ELSE w.normalcapacitykg END) - COALESCE(u.used, 0) >= :quantity_kg
+                ORDER BY w.location <-> ST_GeogFromText(:supplier_location)
                 LIMIT 1
             """)
 
@@ -167,66 +189,107 @@ class WarehouseRepository:
                 return None
 
             location = Location(latitude=row.latitude, longitude=row.longitude)
-            return Warehouse(
+            warehouse = Warehouse(
                 warehouse_id=row.warehouseid,
                 name=row.name,  # This needs to be added to the query
                 location=location,
                 normal_capacity_kg=row.normalcapacitykg,
                 refrigerated_capacity_kg=row.refrigeratedcapacitykg,
             )
+            nearest_warehouse_cache.set(cache_key, replace(warehouse))
+            return warehouse
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to find suitable warehouse: {str(e)}")
 
-    async def get_products_in_storage(self, warehouse_id: int) -> List[Dict[str, Any]]:
-        """Get all products currently in storage at a specific warehouse"""
+    async def get_all_with_products(
+        self,
+    ) -> List[Tuple[Warehouse, List[Dict[str, Any]]]]:
+        """Get all warehouses with their in-stock products in a single query"""
+        try:
+            result = await self.session.execute(self._select_with_products())
+
+            return self._group_products_by_warehouse(result.all())
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get warehouses with products: {str(e)}")
+
+    async def get_by_id_with_products(
+        self, warehouse_id: int
+    ) -> Optional[Tuple[Warehouse, List[Dict[str, Any]]]]:
+        """Get a warehouse with its in-stock products in a single query"""
         try:
             result = await self.session.execute(
-                select(
-                    ProductRecordModel.RecordID,
-                    ProductRecordModel.ProductID,
-                    ProductRecordModel.QuantityKg,
-                    ProductRecordModel.QualityClassification,
-                    ProductRecordModel.Status,
-                    ProductRecordModel.RegistrationDate,
-                    ProductModel.Name,
-                    ProductModel.RequiresRefrigeration,
-                    ProductModel.BasePrice,
-                    ProductModel.ShelfLifeDays,
-                    ProductModel.DeadlineToDiscount,
-                )
-                .join(
-                    ProductModel, ProductRecordModel.ProductID == ProductModel.ProductID
+                self._select_with_products().where(
+                    WarehouseModel.WarehouseID == warehouse_id
                 )
-                .where(
-                    ProductRecordModel.WarehouseID == warehouse_id,
+            )
+            warehouses = self._group_products_by_warehouse(result.all())
+
+            return warehouses[0] if warehouses else None
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get warehouse with products: {str(e)}")
+
+    def _select_with_products(self):
+        """Warehouses left-joined to their in-stock product records and products"""
+        return (
+            select(
+                *_WAREHOUSE_COLUMNS,
+                ProductRecordModel.RecordID,
+                ProductRecordModel.ProductID,
+                ProductRecordModel.QuantityKg,
+                ProductRecordModel.QualityClassification,
+                ProductRecordModel.Status,
+                ProductRecordModel.RegistrationDate,
+                ProductModel.Name.label("ProductName"),
+                ProductModel.RequiresRefrigeration,
+                ProductModel.BasePrice,
+                ProductModel.ShelfLifeDays,
+                ProductModel.DeadlineToDiscount,
+            )
+            .outerjoin(
+                ProductRecordModel,
+                and_(
+                    ProductRecordModel.WarehouseID == WarehouseModel.WarehouseID,
                     ProductRecordModel.Status == "InStock",
-                )
+                ),
             )
-            rows = result.all()
+            .outerjoin(
+                ProductModel, ProductRecordModel.ProductID == ProductModel.ProductID
+            )
+            .order_by(WarehouseModel.WarehouseID)
+        )
 
-            products_in_storage = []
-            for row in rows:
-                products_in_storage.append(
-                    {
-                        "record_id": row.RecordID,
-                        "product_id": row.ProductID,
-                        "product_name": row.Name,
-                        "quantity_kg": row.QuantityKg,
-                        "quality_classification": row.QualityClassification,
-                        "status": row.Status,
-                        "registration_date": row.RegistrationDate,
-                        "requires_refrigeration": row.RequiresRefrigeration,
-                        "base_price": row.BasePrice,
-                        "shelf_life_days": row.ShelfLifeDays,
-                        "deadline_to_discount": row.DeadlineToDiscount,
-                    }
-                )
+    def _group_products_by_warehouse(
+        self, rows
+    ) -> List[Tuple[Warehouse, List[Dict[str, Any]]]]:
+        """Group joined rows back into one entry per warehouse, keeping row order"""
+        warehouses: Dict[int, Tuple[Warehouse, List[Dict[str, Any]]]] = {}
+        for row in rows:
+            warehouse_id = row.WarehouseID
+            if warehouse_id not in warehouses:
+                warehouses[warehouse_id] = (self._row_to_entity(row), [])
+            if row.RecordID is not None and row.ProductName is not None:
+                warehouses[warehouse_id][1].append(self._row_to_product_in_storage(row))
 
-            return products_in_storage
+        return list(warehouses.values())
 
-        except SQLAlchemyError as e:
-            raise Exception(f"Failed to get products in storage: {str(e)}")
+    def _row_to_product_in_storage(self, row) -> Dict[str, Any]:
+        """Convert a product record/product row to a products-in-storage dict"""
+        return {
+            "record_id": row.RecordID,
+            "product_id": row.ProductID,
+            "product_name": row.ProductName,
+            "quantity_kg": row.QuantityKg,
+            "quality_classification": row.QualityClassification,
+            "status": row.Status,
+            "registration_date": row.RegistrationDate,
+            "requires_refrigeration": row.RequiresRefrigeration,
+            "base_price": row.BasePrice,
+            "shelf_life_days": row.ShelfLifeDays,
+            "deadline_to_discount": row.DeadlineToDiscount,
+        }
 
     def _model_to_entity(
         self, warehouse_model: WarehouseModel, name: str, location: Location
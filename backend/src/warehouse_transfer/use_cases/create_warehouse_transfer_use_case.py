@@ -1,5 +1,5 @@
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import timedelta
+from typing import List, Optional
 from src.warehouse_transfer.warehouse_transfer_entity import (
     WarehouseTransfer,
     TransferStatus,
@@ -15,7 +15,7 @@ from src.warehouse_transfer.warehouse_transfer_dto import (
 from src.truck.truck_repository import TruckRepository
 from src.truck.truck_entity import TruckStatus
 from src.warehouse.warehouse_repository import WarehouseRepository
-from src.base import Location
+from src.base import Location, haversine_distances_km
 import math
 
 
@@ -35,13 +35,12 @@ class CreateWarehouseTransferUseCase:
     ) -> CreateWarehouseTransferResponseDto:
         """Create a new warehouse transfer and assign a driver automatically"""
 
-        # Get warehouse locations for distance calculation
-        origin_warehouse = await self._warehouse_repository.get_by_id(
-            create_dto.origin_warehouse_id
-        )
-        destination_warehouse = await self._warehouse_repository.get_by_id(
-            create_dto.destination_warehouse_id
+        # Get both warehouse locations for distance calculation in one query
+        warehouses = await self._warehouse_repository.get_by_ids(
+            [create_dto.origin_warehouse_id, create_dto.destination_warehouse_id]
         )
+        origin_warehouse = warehouses.get(create_dto.origin_warehouse_id)
+        destination_warehouse = warehouses.get(create_dto.destination_warehouse_id)
 
         if not origin_warehouse or not destination_warehouse:
             raise ValueError("Invalid warehouse IDs provided")
@@ -56,8 +55,73 @@ class CreateWarehouseTransferUseCase:
             origin_warehouse.location, destination_warehouse.location
         )
 
-        # Create warehouse transfer
-        transfer = WarehouseTransfer(
+        transfer = self._build_transfer(create_dto, available_truck, estimated_time)
+        created_transfer = await self._transfer_repository.create(transfer)
+
+        # Update truck status if truck assigned
+        if available_truck:
+            await self._truck_repository.update_status_and_location(
+                available_truck.truck_id, TruckStatus.IN_SERVICE
+            )
+
+        return self._build_response(created_transfer)
+
+    async def execute_many(
+        self, create_dtos: List[CreateWarehouseTransferDto]
+    ) -> List[CreateWarehouseTransferResponseDto]:
+        """Create several warehouse transfers at once, each with its own driver"""
+        warehouses = await self._warehouse_repository.get_by_ids(
+            list(
+                {dto.origin_warehouse_id for dto in create_dtos}
+                | {dto.destination_warehouse_id for dto in create_dtos}
+            )
+        )
+        for create_dto in create_dtos:
+            if (
+                create_dto.origin_warehouse_id not in warehouses
+                or create_dto.destination_warehouse_id not in warehouses
+            ):
+                raise ValueError("Invalid warehouse IDs provided")
+
+        # Trucks are loaded once and handed out closest-first, one per transfer
+        available_trucks = await self._get_available_trucks_with_drivers()
+        assigned_trucks = []
+        transfers = []
+        for create_dto in create_dtos:
+            origin_warehouse = warehouses[create_dto.origin_warehouse_id]
+            destination_warehouse = warehouses[create_dto.destination_warehouse_id]
+
+            available_truck = self._closest_truck(
+                origin_warehouse.location, available_trucks
+            )
+            if available_truck:
+                available_trucks.remove(available_truck)
+                assigned_trucks.append(available_truck)
+
+            estimated_time = self._calculate_estimated_time(
+                origin_warehouse.location, destination_warehouse.location
+            )
+            transfers.append(
+                self._build_transfer(create_dto, available_truck, estimated_time)
+            )
+
+        created_transfers = await self._transfer_repository.create_many(transfers)
+
+        for truck in assigned_trucks:
+            await self._truck_repository.update_status_and_location(
+                truck.truck_id, TruckStatus.IN_SERVICE
+            )
+
+        return [self._build_response(transfer) for transfer in created_transfers]
+
+    def _build_transfer(
+        self,
+        create_dto: CreateWarehouseTransferDto,
+        available_truck,
+        estimated_time: timedelta,
+    ) -> WarehouseTransfer:
+        """Build a pending transfer entity for the given request"""
+        return WarehouseTransfer(
             transfer_id=None,
             record_id=create_dto.record_id,
             origin_warehouse_id=create_dto.origin_warehouse_id,
@@ -67,71 +131,60 @@ class CreateWarehouseTransferUseCase:
             status=TransferStatus.PENDING,
             estimated_time=estimated_time,
             actual_time=None,
-            requested_date=datetime.utcnow(),
+            requested_date=None,
             start_date=None,
             completed_date=None,
             notes=create_dto.notes,
         )
 
-        created_transfer = await self._transfer_repository.create(transfer)
-
-        # Update truck status if truck assigned
-        if available_truck:
-            await self._truck_repository.update_status_and_location(
-                available_truck.truck_id, TruckStatus.IN_SERVICE
-            )
-
+    def _build_response(
+        self, created_transfer: WarehouseTransfer
+    ) -> CreateWarehouseTransferResponseDto:
         return CreateWarehouseTransferResponseDto(
             transfer_id=created_transfer.transfer_id,
             message="Warehouse transfer created successfully"
             + (
                 " and driver assigned"
-                if available_truck
+                if created_transfer.truck_id is not None
                 else " - waiting for available driver"
             ),
         )
 
     async def _find_closest_available_truck(
-        self, origin_location: Location, required_truck_type=None
+        self, origin_location: Location
     ) -> Optional[object]:
         """Find the closest available truck with driver to the origin warehouse"""
+        available_trucks = await self._get_available_trucks_with_drivers()
+        return self._closest_truck(origin_location, available_trucks)
+
+    async def _get_available_trucks_with_drivers(self):
+        """Get available trucks that have a driver assigned"""
         available_trucks = await self._truck_repository.get_by_status(
             TruckStatus.AVAILABLE
         )
 
-        # Filter trucks that have drivers
-        trucks_with_drivers = [
+        return [
             truck for truck in available_trucks if truck.truck_driver_id is not None
         ]
 
+    def _closest_truck(self, origin_location: Location, trucks_with_drivers):
+        """Pick the truck closest to the origin location"""
         if not trucks_with_drivers:
             return None
 
-        # Filter by truck type if specified (useful for refrigerated transfers)
-        if required_truck_type:
-            trucks_with_drivers = [
-                truck
-                for truck in trucks_with_drivers
-                if truck.type == required_truck_type
-            ]
-            if not trucks_with_drivers:
-                return None
-
-        # Find closest truck by calculating distances
-        closest_truck = None
-        min_distance = float("inf")
-
-        for truck in trucks_with_drivers:
-            if truck.current_location:
-                distance = self._calculate_distance_km(
-                    origin_location, truck.current_location
-                )
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_truck = truck
+        # Find closest truck by calculating all distances in one pass
+        located_trucks = [
+            truck for truck in trucks_with_drivers if truck.current_location
+        ]
 
         # If no truck has location data, return first available
-        return closest_truck or trucks_with_drivers[0]
+        if not located_trucks:
+            return trucks_with_drivers[0]
+
+        distances = haversine_distances_km(
+            origin_location, [truck.current_location for truck in located_trucks]
+        )
+        return located_trucks[int(distances.argmin())]
 
     def _calculate_estimated_time(
         self, origin: Location, destination: Location
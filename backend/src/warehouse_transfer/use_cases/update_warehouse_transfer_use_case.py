@@ -1,5 +1,5 @@
-from typing import Optional
-from datetime import datetime
+from typing import Any, Dict, Optional
+from datetime import datetime, timezone
 from src.warehouse_transfer.warehouse_transfer_entity import (
     WarehouseTransfer,
     TransferStatus,
@@ -16,6 +16,26 @@ from src.truck.truck_repository import TruckRepository
 from src.truck.truck_entity import TruckStatus
 from src.product_record.product_record_repository import ProductRecordRepository
 
+# Update DTO fields written as-is when supplied, with their model attribute
+_UPDATABLE_COLUMNS = {
+    "truck_id": "TruckID",
+    "estimated_time": "EstimatedTime",
+    "actual_time": "ActualTime",
+    "start_date": "StartDate",
+    "completed_date": "CompletedDate",
+    "notes": "Notes",
+}
+
+# (old status, new status) transitions that stamp a date column, unless supplied
+_TRANSITION_TIMESTAMPS = {
+    (TransferStatus.PENDING, TransferStatus.IN_TRANSIT): "StartDate",
+    **{
+        (status, TransferStatus.COMPLETED): "CompletedDate"
+        for status in TransferStatus
+        if status != TransferStatus.COMPLETED
+    },
+}
+
 
 class UpdateWarehouseTransferUseCase:
     def __init__(
@@ -33,64 +53,40 @@ class UpdateWarehouseTransferUseCase:
     ) -> Optional[WarehouseTransferResponseDto]:
         """Update an existing warehouse transfer with business logic"""
 
-        # Get existing transfer
-        existing_transfer = await self._transfer_repository.get_by_id(transfer_id)
+        # Get existing transfer, locked so concurrent updates of the same transfer
+        # wait here and see the status this one commits (the whole request runs
+        # in the session's single transaction)
+        existing_transfer = await self._transfer_repository.get_by_id_for_update(
+            transfer_id
+        )
         if not existing_transfer:
             return None
 
+        # Only the columns the caller supplied are written
+        changes: Dict[str, Any] = {
+            column: getattr(update_dto, field)
+            for field, column in _UPDATABLE_COLUMNS.items()
+            if getattr(update_dto, field) is not None
+        }
+
+        # Nothing supplied (e.g. an idempotent retry): skip the write and side effects
+        if not changes and update_dto.status is None:
+            return warehouse_transfer_to_response_dto(existing_transfer)
+
         # Handle status change logic
         old_status = existing_transfer.status
         new_status = update_dto.status or existing_transfer.status
+        if update_dto.status is not None:
+            changes["Status"] = new_status.value
 
-        # Set start_date automatically when status changes to IN_TRANSIT
-        start_date = (
-            update_dto.start_date if hasattr(update_dto, "start_date") else None
-        )
-        if (
-            new_status == TransferStatus.IN_TRANSIT
-            and old_status == TransferStatus.PENDING
-            and start_date is None
-        ):
-            start_date = datetime.utcnow()
-
-        # Set completed_date automatically when status becomes COMPLETED
-        completed_date = (
-            update_dto.completed_date if hasattr(update_dto, "completed_date") else None
-        )
-        if (
-            new_status == TransferStatus.COMPLETED
-            and old_status != TransferStatus.COMPLETED
-            and completed_date is None
-        ):
-            completed_date = datetime.utcnow()
-
-        # Create updated transfer
-        updated_transfer = WarehouseTransfer(
-            transfer_id=existing_transfer.transfer_id,
-            record_id=existing_transfer.record_id,
-            origin_warehouse_id=existing_transfer.origin_warehouse_id,
-            destination_warehouse_id=existing_transfer.destination_warehouse_id,
-            truck_id=update_dto.truck_id
-            if update_dto.truck_id is not None
-            else existing_transfer.truck_id,
-            reason=existing_transfer.reason,
-            status=new_status,
-            estimated_time=update_dto.estimated_time
-            if update_dto.estimated_time is not None
-            else existing_transfer.estimated_time,
-            actual_time=update_dto.actual_time
-            if update_dto.actual_time is not None
-            else existing_transfer.actual_time,
-            requested_date=existing_transfer.requested_date,
-            start_date=start_date or existing_transfer.start_date,
-            completed_date=completed_date or existing_transfer.completed_date,
-            notes=update_dto.notes
-            if update_dto.notes is not None
-            else existing_transfer.notes,
-        )
+        # Stamp StartDate/CompletedDate on the transitions that set them
+        timestamp_column = _TRANSITION_TIMESTAMPS.get((old_status, new_status))
+        if timestamp_column and timestamp_column not in changes:
+            # Naive UTC, matching the TIMESTAMP columns, without the deprecated utcnow()
+            changes[timestamp_column] = datetime.now(timezone.utc).replace(tzinfo=None)
 
         # Update the transfer
-        result = await self._transfer_repository.update(transfer_id, updated_transfer)
+        result = await self._transfer_repository.update_partial(transfer_id, changes)
         if not result:
             return None
 
@@ -110,7 +106,7 @@ class UpdateWarehouseTransferUseCase:
             and old_status == TransferStatus.PENDING
             and transfer.truck_id
         ):
-            await self._truck_repository.update_status_and_location(
+            await self._truck_repository.set_status_if_changed(
                 transfer.truck_id, TruckStatus.IN_SERVICE
             )
 
@@ -128,7 +124,7 @@ class UpdateWarehouseTransferUseCase:
 
             # Set truck back to available
             if transfer.truck_id:
-                await self._truck_repository.update_status_and_location(
+                await self._truck_repository.set_status_if_changed(
                     transfer.truck_id, TruckStatus.AVAILABLE
                 )
 
@@ -138,6 +134,6 @@ class UpdateWarehouseTransferUseCase:
             and old_status not in [TransferStatus.CANCELLED, TransferStatus.PENDING]
             and transfer.truck_id
         ):
-            await self._truck_repository.update_status_and_location(
+            await self._truck_repository.set_status_if_changed(
                 transfer.truck_id, TruckStatus.AVAILABLE
             )
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from src.base import etag_json_response
 from src.database.connection import get_db_session
 from src.warehouse_transfer.warehouse_transfer_dto import (
     CreateWarehouseTransferDto,
     UpdateWarehouseTransferDto,
     WarehouseTransferResponseDto,
     CreateWarehouseTransferResponseDto,
+    warehouse_transfer_to_response_dto,
 )
 from src.warehouse_transfer.use_cases.create_warehouse_transfer_use_case import (
     CreateWarehouseTransferUseCase,
@@ -23,24 +26,76 @@ from src.warehouse.warehouse_repository import WarehouseRepository
 
 router = APIRouter(prefix="/warehouse-transfers", tags=["warehouse-transfers"])
 
+# Serializers for the polled read endpoints, which answer with an ETag
+_transfer_adapter = TypeAdapter(WarehouseTransferResponseDto)
+_transfer_list_adapter = TypeAdapter(List[WarehouseTransferResponseDto])
+
+
+# Dependencies
+def get_warehouse_transfer_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> WarehouseTransferRepository:
+    return WarehouseTransferRepository(session)
+
+
+def get_truck_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> TruckRepository:
+    return TruckRepository(session)
+
+
+def get_warehouse_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> WarehouseRepository:
+    return WarehouseRepository(session)
+
+
+def get_product_record_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> ProductRecordRepository:
+    return ProductRecordRepository(session)
+
+
+def get_create_warehouse_transfer_use_case(
+    transfer_repo: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
+    truck_repo: TruckRepository = Depends(get_truck_repository),
+    warehouse_repo: WarehouseRepository = Depends(get_warehouse_repository),
+) -> CreateWarehouseTransferUseCase:
+    return CreateWarehouseTransferUseCase(
+        transfer_repository=transfer_repo,
+        truck_repository=truck_repo,
+        warehouse_repository=warehouse_repo,
+    )
+
+
+def get_update_warehouse_transfer_use_case(
+    transfer_repo: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
+    truck_repo: TruckRepository = Depends(get_truck_repository),
+    product_record_repo: ProductRecordRepository = Depends(
+        get_product_record_repository
+    ),
+) -> UpdateWarehouseTransferUseCase:
+    return UpdateWarehouseTransferUseCase(
+        transfer_repository=transfer_repo,
+        truck_repository=truck_repo,
+        product_record_repository=product_record_repo,
+    )
+
 
 @router.post("/", response_model=CreateWarehouseTransferResponseDto)
 async def create_warehouse_transfer(
     transfer_dto: CreateWarehouseTransferDto,
+    use_case: CreateWarehouseTransferUseCase = Depends(
+        get_create_warehouse_transfer_use_case
+    ),
     session: AsyncSession = Depends(get_db_session),
 ):
     """Create a new warehouse transfer"""
     try:
-        transfer_repository = WarehouseTransferRepository(session)
-        truck_repository = TruckRepository(session)
-        warehouse_repository = WarehouseRepository(session)
-
-        use_case = CreateWarehouseTransferUseCase(
-            transfer_repository=transfer_repository,
-            truck_repository=truck_repository,
-            warehouse_repository=warehouse_repository,
-        )
-
         result = await use_case.execute(transfer_dto)
         await session.commit()
         return result
@@ -55,17 +110,39 @@ async def create_warehouse_transfer(
         )
 
 
-@router.get("/", response_model=List[WarehouseTransferResponseDto])
-async def get_all_warehouse_transfers(session: AsyncSession = Depends(get_db_session)):
-    """Get all warehouse transfers"""
+@router.post("/bulk", response_model=List[CreateWarehouseTransferResponseDto])
+async def create_warehouse_transfers_bulk(
+    transfer_dtos: List[CreateWarehouseTransferDto],
+    use_case: CreateWarehouseTransferUseCase = Depends(
+        get_create_warehouse_transfer_use_case
+    ),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Create several warehouse transfers in one request"""
     try:
-        repository = WarehouseTransferRepository(session)
-        transfers = await repository.get_all()
+        result = await use_case.execute_many(transfer_dtos)
+        await session.commit()
+        return result
 
-        from src.warehouse_transfer.warehouse_transfer_dto import (
-            warehouse_transfer_to_response_dto,
+    except ValueError as e:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=500, detail=f"Failed to create warehouse transfers: {str(e)}"
         )
 
+
+@router.get("/", response_model=List[WarehouseTransferResponseDto])
+async def get_all_warehouse_transfers(
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
+):
+    """Get all warehouse transfers"""
+    try:
+        transfers = await repository.get_all()
         return [warehouse_transfer_to_response_dto(transfer) for transfer in transfers]
 
     except Exception as e:
@@ -76,22 +153,23 @@ async def get_all_warehouse_transfers(session: AsyncSession = Depends(get_db_ses
 
 @router.get("/{transfer_id}", response_model=WarehouseTransferResponseDto)
 async def get_warehouse_transfer_by_id(
-    transfer_id: int, session: AsyncSession = Depends(get_db_session)
+    transfer_id: int,
+    request: Request,
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
 ):
     """Get warehouse transfer by ID"""
     try:
-        repository = WarehouseTransferRepository(session)
         transfer = await repository.get_by_id(transfer_id)
 
         if not transfer:
             raise HTTPException(status_code=404, detail="Warehouse transfer not found")
 
-        from src.warehouse_transfer.warehouse_transfer_dto import (
-            warehouse_transfer_to_response_dto,
+        return etag_json_response(
+            request, _transfer_adapter, warehouse_transfer_to_response_dto(transfer)
         )
 
-        return warehouse_transfer_to_response_dto(transfer)
-
     except HTTPException:
         raise
     except Exception as e:
@@ -104,20 +182,13 @@ async def get_warehouse_transfer_by_id(
 async def update_warehouse_transfer(
     transfer_id: int,
     update_dto: UpdateWarehouseTransferDto,
+    use_case: UpdateWarehouseTransferUseCase = Depends(
+        get_update_warehouse_transfer_use_case
+    ),
     session: AsyncSession = Depends(get_db_session),
 ):
     """Update warehouse transfer status and details"""
     try:
-        transfer_repository = WarehouseTransferRepository(session)
-        truck_repository = TruckRepository(session)
-        product_record_repository = ProductRecordRepository(session)
-
-        use_case = UpdateWarehouseTransferUseCase(
-            transfer_repository=transfer_repository,
-            truck_repository=truck_repository,
-            product_record_repository=product_record_repository,
-        )
-
         result = await use_case.execute(transfer_id, update_dto)
 
         if not result:
@@ -135,24 +206,52 @@ async def update_warehouse_transfer(
         )
 
 
+@router.get(
+    "/warehouse/{warehouse_id}",
+    response_model=List[WarehouseTransferResponseDto],
+)
+async def get_transfers_for_warehouse(
+    warehouse_id: int,
+    request: Request,
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
+):
+    """Get all incoming and outgoing transfers for a warehouse"""
+    try:
+        transfers = await repository.get_all_for_warehouse(warehouse_id)
+        return etag_json_response(
+            request,
+            _transfer_list_adapter,
+            [warehouse_transfer_to_response_dto(transfer) for transfer in transfers],
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get warehouse transfers: {str(e)}"
+        )
+
+
 @router.get(
     "/warehouse/{warehouse_id}/outgoing",
     response_model=List[WarehouseTransferResponseDto],
 )
 async def get_outgoing_transfers_for_warehouse(
-    warehouse_id: int, session: AsyncSession = Depends(get_db_session)
+    warehouse_id: int,
+    request: Request,
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
 ):
     """Get all outgoing transfers from a warehouse"""
     try:
-        repository = WarehouseTransferRepository(session)
         transfers = await repository.get_by_warehouse(warehouse_id, is_origin=True)
-
-        from src.warehouse_transfer.warehouse_transfer_dto import (
-            warehouse_transfer_to_response_dto,
+        return etag_json_response(
+            request,
+            _transfer_list_adapter,
+            [warehouse_transfer_to_response_dto(transfer) for transfer in transfers],
         )
 
-        return [warehouse_transfer_to_response_dto(transfer) for transfer in transfers]
-
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to get outgoing transfers: {str(e)}"
@@ -164,19 +263,21 @@ async def get_outgoing_transfers_for_warehouse(
     response_model=List[WarehouseTransferResponseDto],
 )
 async def get_incoming_transfers_for_warehouse(
-    warehouse_id: int, session: AsyncSession = Depends(get_db_session)
+    warehouse_id: int,
+    request: Request,
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
 ):
     """Get all incoming transfers to a warehouse"""
     try:
-        repository = WarehouseTransferRepository(session)
         transfers = await repository.get_by_warehouse(warehouse_id, is_origin=False)
-
-        from src.warehouse_transfer.warehouse_transfer_dto import (
-            warehouse_transfer_to_response_dto,
+        return etag_json_response(
+            request,
+            _transfer_list_adapter,
+            [warehouse_transfer_to_response_dto(transfer) for transfer in transfers],
         )
 
-        return [warehouse_transfer_to_response_dto(transfer) for transfer in transfers]
-
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to get incoming transfers: {str(e)}"
@@ -185,17 +286,14 @@ async def get_incoming_transfers_for_warehouse(
 
 @router.get("/truck/{truck_id}", response_model=List[WarehouseTransferResponseDto])
 async def get_transfers_for_truck(
-    truck_id: int, session: AsyncSession = Depends(get_db_session)
+    truck_id: int,
+    repository: WarehouseTransferRepository = Depends(
+        get_warehouse_transfer_repository
+    ),
 ):
     """Get all transfers assigned to a truck"""
     try:
-        repository = WarehouseTransferRepository(session)
         transfers = await repository.get_by_truck_id(truck_id)
-
-        from src.warehouse_transfer.warehouse_transfer_dto import (
-            warehouse_transfer_to_response_dto,
-        )
-
         return [warehouse_transfer_to_response_dto(transfer) for transfer in transfers]
 
     except Exception as e:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional
 from datetime import datetime, timedelta
 from src.warehouse_transfer.warehouse_transfer_entity import (
@@ -8,7 +9,7 @@ from src.warehouse_transfer.warehouse_transfer_entity import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateWarehouseTransferDto:
     record_id: Optional[int]
     origin_warehouse_id: Optional[int]
@@ -18,7 +19,7 @@ class CreateWarehouseTransferDto:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateWarehouseTransferDto:
     truck_id: Optional[int] = None
     status: Optional[TransferStatus] = None
@@ -30,7 +31,7 @@ class UpdateWarehouseTransferDto:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WarehouseTransferResponseDto:
     transfer_id: int
     record_id: Optional[int]
@@ -47,28 +48,63 @@ class WarehouseTransferResponseDto:
     notes: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateWarehouseTransferResponseDto:
     transfer_id: int
     message: str
 
 
+# Member -> value lookups, a dict load instead of the Enum .value descriptor per row
+_TRANSFER_STATUS_VALUES = {status: status.value for status in TransferStatus}
+_TRANSFER_REASON_VALUES = {reason: reason.value for reason in TransferReason}
+
+# Entity fields copied unchanged into the response DTO, read in a single call
+_GET_TRANSFER_FIELDS = attrgetter(
+    "transfer_id",
+    "record_id",
+    "origin_warehouse_id",
+    "destination_warehouse_id",
+    "truck_id",
+    "estimated_time",
+    "actual_time",
+    "requested_date",
+    "start_date",
+    "completed_date",
+    "notes",
+)
+
+
 def warehouse_transfer_to_response_dto(
     transfer: WarehouseTransfer,
 ) -> WarehouseTransferResponseDto:
     """Convert WarehouseTransfer entity to response DTO"""
+    (
+        transfer_id,
+        record_id,
+        origin_warehouse_id,
+        destination_warehouse_id,
+        truck_id,
+        estimated_time,
+        actual_time,
+        requested_date,
+        start_date,
+        completed_date,
+        notes,
+    ) = _GET_TRANSFER_FIELDS(transfer)
+    reason = transfer.reason
+
     return WarehouseTransferResponseDto(
-        transfer_id=transfer.transfer_id,
-        record_id=transfer.record_id,
-        origin_warehouse_id=transfer.origin_warehouse_id,
-        destination_warehouse_id=transfer.destination_warehouse_id,
-        truck_id=transfer.truck_id,
-        status=transfer.status.value,
-        reason=transfer.reason.value if transfer.reason else None,
-        estimated_time=transfer.estimated_time,
-        actual_time=transfer.actual_time,
-        requested_date=transfer.requested_date,
-        start_date=transfer.start_date,
-        completed_date=transfer.completed_date,
-        notes=transfer.notes,
+        transfer_id,
+        record_id,
+        origin_warehouse_id,
+        destination_warehouse_id,
+        truck_id,
+        _TRANSFER_STATUS_VALUES[transfer.status],
+        _TRANSFER_REASON_VALUES[reason] if reason else None,
+        estimated_time,
+        actual_time,
+        requested_date,
+        start_date,
+        completed_date,
+        notes,
     )
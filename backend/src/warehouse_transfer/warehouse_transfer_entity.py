@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
 from datetime import datetime, timedelta
-from sqlalchemy import Column, Integer, String, ForeignKey, Interval, TIMESTAMP
+from sqlalchemy import Column, Integer, String, ForeignKey, Interval, TIMESTAMP, func
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from src.database import Base
 
@@ -21,7 +21,7 @@ class TransferReason(str, Enum):
     OPTIMIZATION = "Optimization"
 
 
-@dataclass
+@dataclass(slots=True)
 class WarehouseTransfer:
     transfer_id: Optional[int]
     record_id: Optional[int]
@@ -38,21 +38,11 @@ class WarehouseTransfer:
     notes: Optional[str]
 
     def __post_init__(self):
-        if isinstance(self.status, str):
+        if not isinstance(self.status, TransferStatus):
             self.status = TransferStatus(self.status)
-        if self.reason is not None and isinstance(self.reason, str):
+        if self.reason is not None and not isinstance(self.reason, TransferReason):
             self.reason = TransferReason(self.reason)
 
-        if self.status not in TransferStatus:
-            raise ValueError(
-                f"Invalid status: {self.status}. Must be one of {list(TransferStatus)}"
-            )
-
-        if self.reason is not None and self.reason not in TransferReason:
-            raise ValueError(
-                f"Invalid reason: {self.reason}. Must be one of {list(TransferReason)}"
-            )
-
 
 class WarehouseTransferModel(Base):
     """SQLAlchemy WarehouseTransfer model for PostgreSQL"""
@@ -81,7 +71,12 @@ class WarehouseTransferModel(Base):
     )
     Status = Column("status", String(20), nullable=False)
     Reason = Column("reason", String(20), nullable=True)
-    RequestedDate = Column("requesteddate", TIMESTAMP, nullable=True)
+    RequestedDate = Column(
+        "requesteddate",
+        TIMESTAMP,
+        nullable=True,
+        server_default=func.timezone("utc", func.now()),
+    )
     StartDate = Column("startdate", TIMESTAMP, nullable=True)
     CompletedDate = Column("completeddate", TIMESTAMP, nullable=True)
     EstimatedTime = Column("estimatedtime", Interval, nullable=True)
@@ -1,7 +1,6 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import insert, lambda_stmt, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from src.warehouse_transfer.warehouse_transfer_entity import (
     WarehouseTransfer,
@@ -10,6 +9,29 @@ from src.warehouse_transfer.warehouse_transfer_entity import (
     WarehouseTransferModel,
 )
 
+_TRANSFER_STATUS_BY_VALUE = {status.value: status for status in TransferStatus}
+_TRANSFER_REASON_BY_VALUE = {reason.value: reason for reason in TransferReason}
+
+# Plain columns for list queries, so rows skip ORM instance hydration
+_TRANSFER_COLUMNS = (
+    WarehouseTransferModel.TransferID,
+    WarehouseTransferModel.RecordID,
+    WarehouseTransferModel.OriginWarehouseID,
+    WarehouseTransferModel.DestinationWarehouseID,
+    WarehouseTransferModel.TruckID,
+    WarehouseTransferModel.Reason,
+    WarehouseTransferModel.Status,
+    WarehouseTransferModel.EstimatedTime,
+    WarehouseTransferModel.ActualTime,
+    WarehouseTransferModel.RequestedDate,
+    WarehouseTransferModel.StartDate,
+    WarehouseTransferModel.CompletedDate,
+    WarehouseTransferModel.Notes,
+)
+
+# Lambda statement so the lookups below reuse their compiled SQL between calls
+_SELECT_TRANSFERS = lambda_stmt(lambda: select(*_TRANSFER_COLUMNS))
+
 
 class WarehouseTransferRepository:
     def __init__(self, session: AsyncSession):
@@ -18,20 +40,7 @@ class WarehouseTransferRepository:
     async def create(self, transfer: WarehouseTransfer) -> WarehouseTransfer:
         """Create a new warehouse transfer"""
         try:
-            transfer_model = WarehouseTransferModel(
-                RecordID=transfer.record_id,
-                OriginWarehouseID=transfer.origin_warehouse_id,
-                DestinationWarehouseID=transfer.destination_warehouse_id,
-                TruckID=transfer.truck_id,
-                Reason=transfer.reason.value if transfer.reason else None,
-                Status=transfer.status.value,
-                EstimatedTime=transfer.estimated_time,
-                ActualTime=transfer.actual_time,
-                RequestedDate=transfer.requested_date or datetime.utcnow(),
-                StartDate=transfer.start_date,
-                CompletedDate=transfer.completed_date,
-                Notes=transfer.notes,
-            )
+            transfer_model = WarehouseTransferModel(**self._entity_to_values(transfer))
 
             self.session.add(transfer_model)
             await self.session.flush()
@@ -40,34 +49,74 @@ class WarehouseTransferRepository:
             return created_transfer
 
         except SQLAlchemyError as e:
-            await self.session.rollback()
             raise Exception(f"Failed to create warehouse transfer: {str(e)}")
 
+    async def create_many(
+        self, transfers: List[WarehouseTransfer]
+    ) -> List[WarehouseTransfer]:
+        """Create several warehouse transfers with a single INSERT ... RETURNING"""
+        if not transfers:
+            return []
+
+        try:
+            result = await self.session.execute(
+                insert(WarehouseTransferModel).returning(
+                    *_TRANSFER_COLUMNS, sort_by_parameter_order=True
+                ),
+                [self._entity_to_values(transfer) for transfer in transfers],
+            )
+
+            return [self._model_to_entity(row) for row in result.all()]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to create warehouse transfers: {str(e)}")
+
     async def get_by_id(self, transfer_id: int) -> Optional[WarehouseTransfer]:
         """Get warehouse transfer by ID"""
         try:
             result = await self.session.execute(
-                select(WarehouseTransferModel).where(
-                    WarehouseTransferModel.TransferID == transfer_id
-                )
+                _SELECT_TRANSFERS
+                + (lambda s: s.where(WarehouseTransferModel.TransferID == transfer_id))
             )
-            transfer_model = result.scalar_one_or_none()
+            row = result.first()
 
-            if not transfer_model:
+            if not row:
                 return None
 
-            return self._model_to_entity(transfer_model)
+            return self._model_to_entity(row)
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get warehouse transfer by ID: {str(e)}")
 
+    async def get_by_id_for_update(
+        self, transfer_id: int
+    ) -> Optional[WarehouseTransfer]:
+        """Get warehouse transfer by ID, row-locking it until the transaction ends"""
+        try:
+            result = await self.session.execute(
+                _SELECT_TRANSFERS
+                + (
+                    lambda s: s.where(
+                        WarehouseTransferModel.TransferID == transfer_id
+                    ).with_for_update()
+                )
+            )
+            row = result.first()
+
+            if not row:
+                return None
+
+            return self._model_to_entity(row)
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to lock warehouse transfer: {str(e)}")
+
     async def get_all(self) -> List[WarehouseTransfer]:
         """Get all warehouse transfers"""
         try:
-            result = await self.session.execute(select(WarehouseTransferModel))
-            transfer_models = result.scalars().all()
+            result = await self.session.execute(_SELECT_TRANSFERS)
 
-            return [self._model_to_entity(model) for model in transfer_models]
+            return [self._model_to_entity(row) for row in result]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get all warehouse transfers: {str(e)}")
@@ -75,14 +124,14 @@ class WarehouseTransferRepository:
     async def get_by_status(self, status: TransferStatus) -> List[WarehouseTransfer]:
         """Get warehouse transfers by status"""
         try:
+            status_value = status.value
             result = await self.session.execute(
-                select(WarehouseTransferModel).where(
-                    WarehouseTransferModel.Status == status.value
-                )
+                _SELECT_TRANSFERS
+                + (lambda s: s.where(WarehouseTransferModel.Status == status_value))
             )
-            transfer_models = result.scalars().all()
+            rows = result.all()
 
-            return [self._model_to_entity(model) for model in transfer_models]
+            return [self._model_to_entity(row) for row in rows]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get warehouse transfers by status: {str(e)}")
@@ -93,79 +142,118 @@ class WarehouseTransferRepository:
         """Get warehouse transfers by origin or destination warehouse"""
         try:
             if is_origin:
-                condition = WarehouseTransferModel.OriginWarehouseID == warehouse_id
+                stmt = _SELECT_TRANSFERS + (
+                    lambda s: s.where(
+                        WarehouseTransferModel.OriginWarehouseID == warehouse_id
+                    )
+                )
             else:
-                condition = (
-                    WarehouseTransferModel.DestinationWarehouseID == warehouse_id
+                stmt = _SELECT_TRANSFERS + (
+                    lambda s: s.where(
+                        WarehouseTransferModel.DestinationWarehouseID == warehouse_id
+                    )
                 )
 
+            result = await self.session.execute(stmt)
+            rows = result.all()
+
+            return [self._model_to_entity(row) for row in rows]
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Failed to get warehouse transfers by warehouse: {str(e)}")
+
+    async def get_all_for_warehouse(self, warehouse_id: int) -> List[WarehouseTransfer]:
+        """Get warehouse transfers where the warehouse is either origin or destination"""
+        try:
             result = await self.session.execute(
-                select(WarehouseTransferModel).where(condition)
+                _SELECT_TRANSFERS
+                + (
+                    lambda s: s.where(
+                        or_(
+                            WarehouseTransferModel.OriginWarehouseID == warehouse_id,
+                            WarehouseTransferModel.DestinationWarehouseID
+                            == warehouse_id,
+                        )
+                    )
+                )
             )
-            transfer_models = result.scalars().all()
+            rows = result.all()
 
-            return [self._model_to_entity(model) for model in transfer_models]
+            return [self._model_to_entity(row) for row in rows]
 
         except SQLAlchemyError as e:
-            raise Exception(f"Failed to get warehouse transfers by warehouse: {str(e)}")
+            raise Exception(
+                f"Failed to get warehouse transfers for warehouse: {str(e)}"
+            )
 
     async def get_by_truck_id(self, truck_id: int) -> List[WarehouseTransfer]:
         """Get warehouse transfers by truck ID"""
         try:
             result = await self.session.execute(
-                select(WarehouseTransferModel).where(
-                    WarehouseTransferModel.TruckID == truck_id
-                )
+                _SELECT_TRANSFERS
+                + (lambda s: s.where(WarehouseTransferModel.TruckID == truck_id))
             )
-            transfer_models = result.scalars().all()
+            rows = result.all()
 
-            return [self._model_to_entity(model) for model in transfer_models]
+            return [self._model_to_entity(row) for row in rows]
 
         except SQLAlchemyError as e:
             raise Exception(f"Failed to get warehouse transfers by truck ID: {str(e)}")
 
-    async def update(
-        self, transfer_id: int, transfer: WarehouseTransfer
+    async def update_partial(
+        self, transfer_id: int, changes: Dict[str, Any]
     ) -> Optional[WarehouseTransfer]:
-        """Update an existing warehouse transfer"""
+        """Update only the given columns (keyed by model attribute) of a warehouse transfer"""
+        if not changes:
+            return await self.get_by_id(transfer_id)
+
         try:
-            stmt = (
+            result = await self.session.execute(
                 update(WarehouseTransferModel)
                 .where(WarehouseTransferModel.TransferID == transfer_id)
-                .values(
-                    TruckID=transfer.truck_id,
-                    Status=transfer.status.value,
-                    EstimatedTime=transfer.estimated_time,
-                    ActualTime=transfer.actual_time,
-                    StartDate=transfer.start_date,
-                    CompletedDate=transfer.completed_date,
-                    Notes=transfer.notes,
-                )
-                .returning(WarehouseTransferModel)
+                .values(**changes)
+                .returning(*_TRANSFER_COLUMNS)
             )
+            row = result.first()
 
-            result = await self.session.execute(stmt)
-            updated_model = result.scalar_one_or_none()
-
-            if updated_model is None:
+            if not row:
                 return None
 
-            return self._model_to_entity(updated_model)
+            return self._model_to_entity(row)
 
         except SQLAlchemyError as e:
-            await self.session.rollback()
             raise Exception(f"Failed to update warehouse transfer: {str(e)}")
 
+    def _entity_to_values(self, transfer: WarehouseTransfer) -> dict:
+        """Convert domain entity to insert values keyed by model attribute"""
+        values = {
+            "RecordID": transfer.record_id,
+            "OriginWarehouseID": transfer.origin_warehouse_id,
+            "DestinationWarehouseID": transfer.destination_warehouse_id,
+            "TruckID": transfer.truck_id,
+            "Reason": transfer.reason.value if transfer.reason else None,
+            "Status": transfer.status.value,
+            "EstimatedTime": transfer.estimated_time,
+            "ActualTime": transfer.actual_time,
+            "StartDate": transfer.start_date,
+            "CompletedDate": transfer.completed_date,
+            "Notes": transfer.notes,
+        }
+        # Left out, RequestedDate is filled in by the column's NOW() default
+        if transfer.requested_date is not None:
+            values["RequestedDate"] = transfer.requested_date
+        return values
+
     def _model_to_entity(self, model: WarehouseTransferModel) -> WarehouseTransfer:
-        """Convert SQLAlchemy model to domain entity"""
+        """Convert SQLAlchemy model (or a _TRANSFER_COLUMNS row) to domain entity"""
         return WarehouseTransfer(
             transfer_id=model.TransferID,
             record_id=model.RecordID,
             origin_warehouse_id=model.OriginWarehouseID,
             destination_warehouse_id=model.DestinationWarehouseID,
             truck_id=model.TruckID,
-            reason=TransferReason(model.Reason) if model.Reason else None,
-            status=TransferStatus(model.Status),
+            reason=_TRANSFER_REASON_BY_VALUE[model.Reason] if model.Reason else None,
+            status=_TRANSFER_STATUS_BY_VALUE[model.Status],
             estimated_time=model.EstimatedTime,
             actual_time=model.ActualTime,
             requested_date=model.RequestedDate,
@@ -26,6 +26,11 @@ CREATE TABLE "User" (
     Role VARCHAR(20) CHECK (Role IN ('Administrator','Supplier','Buyer','TruckDriver')) NOT NULL
 );
 
+-- Role listings, login lookups by contact info, and radius searches over users
+CREATE INDEX idx_user_role ON "User" (Role);
+CREATE INDEX idx_user_contactinfo ON "User" (ContactInfo);
+CREATE INDEX idx_user_location_gist ON "User" USING GIST (Location);
+
 -- ==========================
 -- Truck Table
 -- ==========================
@@ -38,6 +43,15 @@ CREATE TABLE Truck (
     LoadCapacityKg INTEGER
 );
 
+-- Available-truck lookups when assigning trucks to transfers
+CREATE INDEX idx_truck_status ON Truck (Status);
+CREATE INDEX idx_truck_driver ON Truck (TruckDriverID);
+
+-- Radius searches over truck locations: GiST for narrow radii, BRIN for wide
+-- scans over very large fleets (a few MB where GiST would take hundreds)
+CREATE INDEX idx_truck_location_gist ON Truck USING GIST (CurrentLocation);
+CREATE INDEX idx_truck_location_brin ON Truck USING BRIN (CurrentLocation) WITH (pages_per_range = 32);
+
 -- ==========================
 -- Order Table
 -- ==========================
@@ -90,6 +104,9 @@ CREATE TABLE Warehouse (
     RefrigeratedCapacityKg INTEGER
 );
 
+-- Radius searches and nearest-warehouse (KNN) ordering over warehouse locations
+CREATE INDEX idx_warehouse_location_gist ON Warehouse USING GIST (Location);
+
 -- ==========================
 -- ProductRecord Table
 -- ==========================
@@ -106,6 +123,9 @@ CREATE TABLE ProductRecord (
     SaleDate TIMESTAMP
 );
 
+-- Warehouse usage sums stock per warehouse without touching the heap
+CREATE INDEX idx_productrecord_warehouse_status ON ProductRecord (WarehouseID, Status) INCLUDE (ProductID, QuantityKg);
+
 -- ==========================
 -- Quote Table
 -- ==========================
@@ -139,7 +159,7 @@ CREATE TABLE WarehouseTransfer (
     DestinationWarehouseID INT REFERENCES Warehouse(WarehouseID) ON DELETE SET NULL,
     Status VARCHAR(20) CHECK (Status IN ('Pending','InTransit','Completed','Cancelled')) NOT NULL,
     Reason VARCHAR(20) CHECK (Reason IN ('Restock','Redistribution','Emergency','Optimization')),
-    RequestedDate TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    RequestedDate TIMESTAMP DEFAULT (NOW() AT TIME ZONE 'utc'),
     StartDate TIMESTAMP,
     CompletedDate TIMESTAMP,
     EstimatedTime INTERVAL,
@@ -147,6 +167,12 @@ CREATE TABLE WarehouseTransfer (
     Notes VARCHAR(500)
 );
 
+-- Transfer listings filter by status, by either warehouse, or by truck
+CREATE INDEX idx_warehousetransfer_status ON WarehouseTransfer (Status);
+CREATE INDEX idx_warehousetransfer_origin ON WarehouseTransfer (OriginWarehouseID);
+CREATE INDEX idx_warehousetransfer_destination ON WarehouseTransfer (DestinationWarehouseID);
+CREATE INDEX idx_warehousetransfer_truck ON WarehouseTransfer (TruckID);
+
 -- ==========================
 -- TRIGGERS FOR AUTOMATIC PRODUCT RECORD MANAGEMENT
 -- ==========================
@@ -229,4 +255,27 @@ BEGIN
     GET DIAGNOSTICS updated_count = ROW_COUNT;
     RETURN updated_count;
 END;
-$$ LANGUAGE plpgsql;
\ No newline at end of file
+$$ LANGUAGE plpgsql;
+
+-- ==========================
+-- TRIGGERS FOR TRUCK LOCATION STORAGE
+-- ==========================
+
+-- Function to drop coordinate precision beyond 6 decimal places (~10cm) so
+-- truck points compress better on disk
+CREATE OR REPLACE FUNCTION quantize_truck_location()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.CurrentLocation IS NOT NULL THEN
+        NEW.CurrentLocation := ST_QuantizeCoordinates(NEW.CurrentLocation::geometry, 6)::geography;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Trigger for quantizing truck locations on INSERT and UPDATE
+CREATE TRIGGER trigger_quantize_truck_location
+    BEFORE INSERT OR UPDATE OF CurrentLocation ON Truck
+    FOR EACH ROW
+    EXECUTE FUNCTION quantize_truck_location();
\ No newline at end of file
@@ -31,6 +31,7 @@ async def main():
 
     # Initialize managers
     db_manager = DatabaseManager()
+    file_manager = None
 
     try:
         # Connect to services
@@ -56,6 +57,8 @@ async def main():
         print(f"Error during population: {e}")
         raise
     finally:
+        if file_manager:
+            file_manager.close()
         await db_manager.disconnect()
 
 
@@ -8,364 +8,401 @@ This script pre-generates all location data to avoid real-time geocoding during
 
 import asyncio
 import json
-import random
+import re
+import sqlite3
 from datetime import datetime
+from functools import partial
+from pathlib import Path
+import numpy as np
+import orjson
+import reverse_geocoder as rg
 from tqdm.asyncio import tqdm
 from src.geocoding_utils import GeocodingService
 from src.data import PORTUGAL_BOUNDS, PORTUGUESE_CITIES
 
+# Matches "Espanha", "España", "Espana" or "Spain" anywhere in an address
+SPAIN_RE = re.compile(r"Espa(?:nh|ñ|n)a|Spain")
+
+# Reverse-geocoded addresses persisted across runs, keyed by coordinate_cell
+GEOCODE_CACHE_FILE = "geocode_cache.db"
 
-def generate_portugal_coordinates():
-    """Generate random coordinates within Portugal's boundaries"""
-    # Use a hybrid approach: 70% of the time use bounded random coordinates,
-    # 30% of the time use coordinates near existing Portuguese cities
-    if random.random() < 0.7:
-        longitude = random.uniform(
-            PORTUGAL_BOUNDS["min_longitude"], PORTUGAL_BOUNDS["max_longitude"]
-        )
-        latitude = random.uniform(
-            PORTUGAL_BOUNDS["min_latitude"], PORTUGAL_BOUNDS["max_latitude"]
-        )
-        return (longitude, latitude)
-    else:
-        # Pick a random city and add small random offset to ensure variety
-        base_city_coords = random.choice(PORTUGUESE_CITIES)[1]
-        # Add small random offset (max ~20km in any direction)
-        longitude_offset = random.uniform(-0.2, 0.2)
-        latitude_offset = random.uniform(-0.15, 0.15)
-
-        return (
-            base_city_coords[0] + longitude_offset,
-            base_city_coords[1] + latitude_offset,
-        )
 
+# City coordinates as an array, so candidate offsets are added in one vectorized step
+PORTUGUESE_CITY_COORDS = np.array([coords for _, coords in PORTUGUESE_CITIES])
 
-def generate_city_coordinates():
-    """Get random coordinates from Portuguese cities for warehouses/trucks with small random offset"""
-    city_name, base_coords = random.choice(PORTUGUESE_CITIES)
+# Candidate coordinates generated per vectorized batch
+COORDINATE_BATCH_SIZE = 5000
 
-    # Add small random offset to avoid exact duplicates
-    longitude_offset = random.uniform(-0.5, 0.5)  # ~5km offset
-    latitude_offset = random.uniform(-0.4, 0.4)  # ~4km offset
 
-    return (base_coords[0] + longitude_offset, base_coords[1] + latitude_offset)
+def keep_portuguese_candidates(batch: np.ndarray) -> np.ndarray:
+    """Drop (longitude, latitude) candidates whose nearest GeoNames place is outside Portugal"""
+    # Offline kd-tree lookup, so Spanish candidates never cost a Nominatim request
+    places = rg.search(
+        [(latitude, longitude) for longitude, latitude in batch.tolist()],
+        mode=1,
+        verbose=False,
+    )
+    in_portugal = np.fromiter(
+        (place["cc"] == "PT" for place in places), dtype=bool, count=len(places)
+    )
+    return batch[in_portugal]
+
+
+def generate_portugal_coordinates(rng, batch_size: int = COORDINATE_BATCH_SIZE):
+    """Endless random (longitude, latitude) candidates within Portugal's boundaries"""
+    bounds_low = [PORTUGAL_BOUNDS["min_longitude"], PORTUGAL_BOUNDS["min_latitude"]]
+    bounds_high = [PORTUGAL_BOUNDS["max_longitude"], PORTUGAL_BOUNDS["max_latitude"]]
+
+    while True:
+        # Use a hybrid approach: 70% of the time use bounded random coordinates,
+        # 30% of the time use coordinates near existing Portuguese cities
+        bounded = rng.uniform(bounds_low, bounds_high, size=(batch_size, 2))
+
+        # Random city plus small random offset (max ~20km in any direction)
+        near_city = PORTUGUESE_CITY_COORDS[
+            rng.integers(0, len(PORTUGUESE_CITY_COORDS), batch_size)
+        ] + rng.uniform([-0.2, -0.15], [0.2, 0.15], size=(batch_size, 2))
+
+        use_bounded = rng.random(batch_size) < 0.7
+        batch = np.where(use_bounded[:, None], bounded, near_city)
+        yield from map(tuple, keep_portuguese_candidates(batch).tolist())
+
+
+def generate_city_coordinates(rng, batch_size: int = COORDINATE_BATCH_SIZE):
+    """Endless (longitude, latitude) candidates near Portuguese cities for warehouses/trucks"""
+    while True:
+        # Random city plus small random offset to avoid exact duplicates
+        batch = PORTUGUESE_CITY_COORDS[
+            rng.integers(0, len(PORTUGUESE_CITY_COORDS), batch_size)
+        ] + rng.uniform([-0.5, -0.4], [0.5, 0.4], size=(batch_size, 2))
+        yield from map(tuple, keep_portuguese_candidates(batch).tolist())
+
+
+def open_geocode_cache(path: str = GEOCODE_CACHE_FILE) -> sqlite3.Connection:
+    """Open the on-disk geocoding cache, creating its table on first use"""
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS cell_cache("
+        "lat_cell INTEGER, lon_cell INTEGER, address TEXT, "
+        "PRIMARY KEY (lat_cell, lon_cell))"
+    )
+    return connection
 
 
-async def save_progress(location_type: str, locations: list, count: int):
-    """Save progress to a temporary file every 10 locations"""
-    filename = f"progress_{location_type}_{count}.json"
-    progress_data = {
-        "type": location_type,
-        "count": count,
-        "timestamp": datetime.now().isoformat(),
-        "locations": locations,
-    }
+def progress_file_name(location_type: str) -> str:
+    """Append-only progress log for a location type"""
+    return f"progress_{location_type}.jsonl"
+
+
+def load_progress(location_type: str) -> list:
+    """Read locations accepted by an interrupted earlier run, if any"""
+    try:
+        with open(progress_file_name(location_type), "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"⚠️ Failed to load progress: {e}")
+        return []
+
+
+def coordinate_cell(longitude: float, latitude: float) -> tuple:
+    """Grid cell of a candidate (0.01 degrees, about 1km), for skipping repeat queries"""
+    return round(latitude * 100), round(longitude * 100)
+
 
+def seed_queried_cells(geocode_cache, locations, seen_addresses, queried_cells):
+    """Mark cells that cannot yield a new location as already queried"""
+    # Cells of locations resumed from the progress log are already taken
+    queried_cells.update(
+        coordinate_cell(location["longitude"], location["latitude"])
+        for location in locations
+    )
+    # Cached cells whose address would be rejected again (Spain or duplicate)
+    for lat_cell, lon_cell, address in geocode_cache.execute(
+        "SELECT lat_cell, lon_cell, address FROM cell_cache"
+    ):
+        if SPAIN_RE.search(address) or address.strip().lower() in seen_addresses:
+            queried_cells.add((lat_cell, lon_cell))
+
+
+def open_progress_file(location_type: str):
+    """Open the progress log for appending, once per location type"""
+    return open(progress_file_name(location_type), "a", encoding="utf-8")
+
+
+def append_progress(progress_file, location: dict):
+    """Append one accepted location to the progress log"""
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(progress_data, f, indent=2, ensure_ascii=False)
-        print(f" Saved progress: {filename}")
+        progress_file.write(json.dumps(location, ensure_ascii=False) + "\n")
+        progress_file.flush()
     except Exception as e:
         print(f"⚠️ Failed to save progress: {e}")
 
 
 def cleanup_progress_files():
     """Clean up temporary progress files"""
-    import glob
-    import os
-
-    progress_files = glob.glob("progress_*.json")
-    for file in progress_files:
+    for file in Path(".").glob("progress_*.jsonl"):
         try:
-            os.remove(file)
-            print(f"️ Cleaned up: {file}")
+            file.unlink(missing_ok=True)
+            print(f"🗑️ Cleaned up: {file}")
         except Exception as e:
             print(f"⚠️ Failed to remove {file}: {e}")
 
 
-async def process_coordinate_batch(
+async def generate_unique_locations(
     geocoding_service,
-    coordinates_batch,
+    geocode_cache,
+    coordinate_factory,
+    target,
     location_type,
-    semaphore,
     seen_addresses,
+    queried_cells,
     stats,
+    lenient_after,
+    concurrency=10,
+    verbose=False,
 ):
-    """Process a batch of coordinates in parallel"""
+    """
+    Geocode candidate coordinates until `target` unique Portuguese locations are found
+
+    Keeps `concurrency` geocoding requests in flight and queues a fresh candidate
+    as each one completes, so Spain/duplicate rejections are replaced right away
+    instead of paying a full round-trip per attempt. The GeocodingService rate
+    limiter keeps the overall request rate within the provider's limit. Candidates
+    falling in a grid cell that was already queried are skipped without a lookup.
+    """
+    # Resume from the progress log of an interrupted run
+    locations = load_progress(location_type)[:target]
+    seen_addresses.update(location["address"].strip().lower() for location in locations)
+    seed_queried_cells(geocode_cache, locations, seen_addresses, queried_cells)
+    if locations:
+        print(
+            f"♻️ Resuming {location_type} locations: {len(locations)} loaded from progress"
+        )
+    attempts = 0
 
     async def process_single_coordinate(coord_data):
         longitude, latitude = coord_data
-        async with semaphore:  # Limit concurrent requests
-            try:
-                # Add a longer delay between requests to avoid timeouts
-                await asyncio.sleep(
-                    1.0
-                )  # 1 second delay = max 1 request per second per worker
-                address = await geocoding_service.coords_to_address(latitude, longitude)
-
-                # Filter out Spain locations immediately and don't print success for them
-                if address:
-                    spain_keywords = ["Espanha", "Spain", "España", "Espana"]
-                    if any(keyword in address for keyword in spain_keywords):
-                        print(
-                            f" SPAIN REJECTED: ({latitude}, {longitude}) → {address}"
-                        )
-                        return longitude, latitude, "SPAIN_REJECTED"
-                    else:
-                        print(
-                            f" PORTUGAL ACCEPTED: ({latitude}, {longitude}) → {address}"
-                        )
-
-                return longitude, latitude, address
-            except Exception as e:
-                print(f"⚠️ Error geocoding ({latitude}, {longitude}): {e}")
-                return longitude, latitude, None
 
-    # Process all coordinates in parallel
-    tasks = [process_single_coordinate(coord) for coord in coordinates_batch]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Filter and validate results
-    valid_locations = []
-    spain_keywords = ["Espanha", "Spain", "España", "Espana"]
+        # Answer from the on-disk cache before spending a rate-limited request;
+        # it shares the cell key with queried_cells, so earlier runs' lookups hit
+        cell = coordinate_cell(longitude, latitude)
+        cached = geocode_cache.execute(
+            "SELECT address FROM cell_cache WHERE lat_cell = ? AND lon_cell = ?", cell
+        ).fetchone()
+        if cached:
+            return longitude, latitude, cached[0]
+
+        address = await geocoding_service.coords_to_address(latitude, longitude)
+        if address is not None:
+            geocode_cache.execute(
+                "INSERT OR REPLACE INTO cell_cache(lat_cell, lon_cell, address) "
+                "VALUES (?, ?, ?)",
+                (*cell, address),
+            )
+            geocode_cache.commit()
+        return longitude, latitude, address
+
+    pending = set()
+    with open_progress_file(location_type) as progress_file, tqdm(
+        total=target,
+        initial=len(locations),
+        desc=f"{location_type.title()} locations",
+        unit="loc",
+    ) as pbar:
+        try:
+            while len(locations) < target:
+                # Top up the in-flight requests with fresh candidates
+                while len(pending) < concurrency:
+                    candidate = coordinate_factory()
+                    cell = coordinate_cell(*candidate)
+                    if cell in queried_cells:
+                        continue
+                    queried_cells.add(cell)
+
+                    pending.add(
+                        asyncio.create_task(process_single_coordinate(candidate))
+                    )
 
-    for result in results:
-        if isinstance(result, Exception):
-            stats["failed_count"] += 1
-            continue
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
 
-        longitude, latitude, address = result
+                for task in done:
+                    if len(locations) >= target:
+                        break
 
-        if address is None:
-            stats["failed_count"] += 1
-            continue
+                    attempts += 1
 
-        # Check for Spain (already filtered in process_single_coordinate)
-        if address == "SPAIN_REJECTED":
-            stats["spain_rejected"] += 1
-            continue
+                    # Become more lenient after many attempts (but NEVER allow Spain)
+                    duplicate_check_enabled = attempts < lenient_after
+                    if attempts == lenient_after:
+                        pbar.write(
+                            f"🔥 {location_type.title()} locations becoming lenient: "
+                            f"Allowing duplicates after {lenient_after} attempts (but NEVER Spain)"
+                        )
 
-        # Check for duplicates (thread-safe check)
-        normalized_address = address.strip().lower()
-        if normalized_address in seen_addresses:
-            stats["duplicate_rejected"] += 1
-            continue
+                    try:
+                        longitude, latitude, address = task.result()
+                    except Exception:
+                        stats["failed_count"] += 1
+                        continue
 
-        # Add to seen addresses
-        seen_addresses.add(normalized_address)
+                    if verbose and attempts % 50 == 0:
+                        pbar.write(
+                            f"🌍 {location_type.title()} attempts: {attempts}, "
+                            f"Generated coordinates: ({longitude}, {latitude})"
+                        )
 
-        location_data = {
-            "longitude": longitude,
-            "latitude": latitude,
-            "address": address,
-            "type": location_type,
-        }
-        valid_locations.append(location_data)
+                    if address is None:
+                        stats["failed_count"] += 1
+                        if verbose:
+                            pbar.write(
+                                f"⚠️ {location_type.title()} geocoding failed for ({longitude}, {latitude})"
+                            )
+                        continue
+
+                    # Check for Spain (ALWAYS reject Spain)
+                    if SPAIN_RE.search(address):
+                        stats["spain_rejected"] += 1
+                        if verbose:
+                            pbar.write(
+                                f"🚫 {location_type.title()} Spain rejected: ({longitude}, {latitude}) → {address}"
+                            )
+                        continue
+
+                    # Check for duplicates (only if enabled)
+                    normalized_address = address.strip().lower()
+                    if duplicate_check_enabled and normalized_address in seen_addresses:
+                        stats["duplicate_rejected"] += 1
+                        if verbose:
+                            pbar.write(
+                                f"🔄 {location_type.title()} duplicate rejected: {address}"
+                            )
+                        continue
+
+                    # Success!
+                    seen_addresses.add(normalized_address)
+                    location_data = {
+                        "longitude": longitude,
+                        "latitude": latitude,
+                        "address": address,
+                        "type": location_type,
+                    }
+                    if verbose:
+                        pbar.write(
+                            f" {location_type.title()} location success: ({longitude}, {latitude}) → {address}"
+                        )
+                    locations.append(location_data)
+                    append_progress(progress_file, location_data)
+                    pbar.update(1)
+        finally:
+            # Drop candidates still in flight once the target is reached
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-    return valid_locations
+    return locations
 
 
-async def generate_locations_with_addresses_sequential(count: int = 1000):
+async def generate_locations_with_addresses_concurrent(
+    count: int = 1000, concurrency: int = 10
+):
     """
-    Generate unique locations with their addresses using reliable sequential geocoding
+    Generate unique locations with their addresses using rate-limited concurrent geocoding
 
     Args:
         count: Number of locations to generate
+        concurrency: Number of geocoding requests kept in flight
 
     Returns:
         Dictionary containing user locations, city locations, and metadata
     """
     print(
-        f" Starting reliable sequential generation of {count} unique locations (240 user + 60 city)..."
+        f"🌍 Starting rate-limited concurrent generation of {count} unique locations (240 user + 60 city)..."
     )
-    print("⚡ Using sequential processing for maximum reliability")
+    print(f"⚡ Keeping {concurrency} geocoding requests in flight")
 
     geocoding_service = GeocodingService(quiet=True)
+    geocode_cache = open_geocode_cache()
+    rng = np.random.default_rng()
     seen_addresses = set()
+    queried_cells = set()
 
     # Statistics tracking
     stats = {"failed_count": 0, "spain_rejected": 0, "duplicate_rejected": 0}
 
-    user_locations = []
-    city_locations = []
     user_target = 240  # 80% of 300
     city_target = 60  # 20% of 300
-    spain_keywords = ["Espanha", "Spain", "España", "Espana"]
 
     # Generate user locations - NEVER GIVE UP!
-    print(" Generating 240 unique user locations...")
-    attempts = 0
-
-    with tqdm(total=user_target, desc="User locations", unit="loc") as pbar:
-        while len(user_locations) < user_target:
-            attempts += 1
-            longitude, latitude = generate_portugal_coordinates()
-
-            # Become more lenient after many attempts (but NEVER allow Spain)
-            duplicate_check_enabled = (
-                attempts < 1000
-            )  # Disable duplicate check after 1000 attempts
-
-            # Show leniency status
-            if attempts == 1000:
-                print(
-                    "\n Becoming lenient: Allowing duplicates after 1000 attempts (but NEVER Spain)"
-                )
-
-            try:
-                # Add delay to be gentle on the API
-                await asyncio.sleep(0.5)  # 500ms delay between requests
-                address = await geocoding_service.coords_to_address(latitude, longitude)
-
-                if address is None:
-                    stats["failed_count"] += 1
-                    continue
-
-                # Check for Spain (ALWAYS reject Spain)
-                if any(keyword in address for keyword in spain_keywords):
-                    stats["spain_rejected"] += 1
-                    continue
-
-                # Check for duplicates (only if enabled)
-                normalized_address = address.strip().lower()
-                if duplicate_check_enabled and normalized_address in seen_addresses:
-                    stats["duplicate_rejected"] += 1
-                    continue
-
-                # Success!
-                seen_addresses.add(normalized_address)
-                location_data = {
-                    "longitude": longitude,
-                    "latitude": latitude,
-                    "address": address,
-                    "type": "user",
-                }
-                user_locations.append(location_data)
-                pbar.update(1)
-
-                # Save progress every 10 locations
-                if len(user_locations) % 10 == 0:
-                    await save_progress("user", user_locations, len(user_locations))
-
-            except Exception as e:
-                stats["failed_count"] += 1
-                continue
+    print("🌍 Generating 240 unique user locations...")
+    user_locations = await generate_unique_locations(
+        geocoding_service,
+        geocode_cache,
+        partial(next, generate_portugal_coordinates(rng)),
+        user_target,
+        "user",
+        seen_addresses,
+        queried_cells,
+        stats,
+        lenient_after=1000,
+        concurrency=concurrency,
+    )
 
     # Generate city locations - NEVER GIVE UP!
-    print(" Generating 60 unique city locations...")
-    city_attempts = 0
-
-    with tqdm(total=city_target, desc="City locations", unit="loc") as pbar:
-        while len(city_locations) < city_target:
-            city_attempts += 1
-            longitude, latitude = generate_city_coordinates()
-
-            # Become more lenient after many attempts for city locations (but NEVER allow Spain)
-            duplicate_check_enabled = (
-                city_attempts < 400
-            )  # Disable duplicate check after 400 attempts
-
-            # Show leniency status for city locations
-            if city_attempts == 400:
-                print(
-                    "\n City locations becoming lenient: Allowing duplicates after 400 attempts (but NEVER Spain)"
-                )
-
-            # Debug city coordinate generation every 50 attempts
-            if city_attempts % 50 == 0:
-                print(
-                    f"\n City attempts: {city_attempts}, Generated coordinates: ({longitude}, {latitude})"
-                )
-
-            try:
-                await asyncio.sleep(0.5)  # 500ms delay
-                address = await geocoding_service.coords_to_address(latitude, longitude)
-
-                if address is None:
-                    stats["failed_count"] += 1
-                    print(f"⚠️ City geocoding failed for ({longitude}, {latitude})")
-                    continue
-
-                # Check for Spain (ALWAYS reject Spain)
-                if any(keyword in address for keyword in spain_keywords):
-                    stats["spain_rejected"] += 1
-                    print(
-                        f" City Spain rejected: ({longitude}, {latitude}) → {address}"
-                    )
-                    continue
-
-                # Check for duplicates (only if enabled)
-                normalized_address = address.strip().lower()
-                if duplicate_check_enabled and normalized_address in seen_addresses:
-                    stats["duplicate_rejected"] += 1
-                    print(f" City duplicate rejected: {address}")
-                    continue
-
-                # Success!
-                seen_addresses.add(normalized_address)
-                location_data = {
-                    "longitude": longitude,
-                    "latitude": latitude,
-                    "address": address,
-                    "type": "city",
-                }
-                print(
-                    f" City location success: ({longitude}, {latitude}) → {address}"
-                )
-                city_locations.append(location_data)
-                pbar.update(1)
-
-                # Save progress every 10 locations
-                if len(city_locations) % 10 == 0:
-                    await save_progress("city", city_locations, len(city_locations))
-
-            except Exception as e:
-                stats["failed_count"] += 1
-                continue
+    print("🌍 Generating 60 unique city locations...")
+    city_locations = await generate_unique_locations(
+        geocoding_service,
+        geocode_cache,
+        partial(next, generate_city_coordinates(rng)),
+        city_target,
+        "city",
+        seen_addresses,
+        queried_cells,
+        stats,
+        lenient_after=400,
+        concurrency=concurrency,
+    )
+    geocode_cache.close()
 
     print(
         f" Generated {len(user_locations)} user locations and {len(city_locations)} city locations"
     )
 
-    # Save final progress files
-    if user_locations:
-        await save_progress("user", user_locations, len(user_locations))
-    if city_locations:
-        await save_progress("city", city_locations, len(city_locations))
-
     # FINAL VALIDATION: Double-check for any Spain locations or duplicates that might have slipped through
-    print(" Final validation: checking for Spain locations and duplicates...")
-
-    all_locations = user_locations + city_locations
-    spain_keywords = ["Espanha", "Spain", "España", "Espana"]
-    validation_errors = []
-
-    # Check for Spain locations
-    for i, location in enumerate(all_locations):
-        address = location["address"]
-        if any(keyword in address for keyword in spain_keywords):
-            validation_errors.append(f"SPAIN FOUND: Index {i}, Address: {address}")
-
-    # Check for duplicates
-    seen_validation = set()
-    for i, location in enumerate(all_locations):
-        normalized_address = location["address"].strip().lower()
-        if normalized_address in seen_validation:
-            validation_errors.append(
-                f"DUPLICATE FOUND: Index {i}, Address: {location['address']}"
+    # Both are already rejected during generation, so this is compiled out under python -O
+    if __debug__:
+        print("🌍 Final validation: checking for Spain locations and duplicates...")
+
+        all_locations = user_locations + city_locations
+        validation_errors = []
+
+        # Check for Spain locations and duplicates in a single pass
+        seen_validation = set()
+        for i, location in enumerate(all_locations):
+            address = location["address"]
+            if SPAIN_RE.search(address):
+                validation_errors.append(f"SPAIN FOUND: Index {i}, Address: {address}")
+
+            normalized_address = address.strip().lower()
+            if normalized_address in seen_validation:
+                validation_errors.append(
+                    f"DUPLICATE FOUND: Index {i}, Address: {address}"
+                )
+            seen_validation.add(normalized_address)
+
+        # If validation errors found, raise exception
+        if validation_errors:
+            print(" VALIDATION FAILED!")
+            for error in validation_errors:
+                print(f"  {error}")
+            raise Exception(
+                f"Validation failed: {len(validation_errors)} errors found. Spain locations or duplicates detected!"
             )
-        seen_validation.add(normalized_address)
-
-    # If validation errors found, raise exception
-    if validation_errors:
-        print(" VALIDATION FAILED!")
-        for error in validation_errors:
-            print(f"  {error}")
-        raise Exception(
-            f"Validation failed: {len(validation_errors)} errors found. Spain locations or duplicates detected!"
-        )
 
-    print(" Validation passed: No Spain locations or duplicates found!")
+        print(" Validation passed: No Spain locations or duplicates found!")
 
     # Compile results
     total_generated = len(user_locations) + len(city_locations)
@@ -394,8 +431,8 @@ async def generate_locations_with_addresses_sequential(count: int = 1000):
             )
             > 0
             else "0%",
-            "validation_passed": True,
-            "processing_mode": "sequential",
+            "validation_passed": __debug__,
+            "processing_mode": "concurrent",
         },
         "user_locations": user_locations,
         "city_locations": city_locations,
@@ -407,24 +444,24 @@ async def generate_locations_with_addresses_sequential(count: int = 1000):
 async def main():
     """Main function to generate locations and save to JSON"""
     print("=" * 60)
-    print("️  RELIABLE LOCATION GENERATOR FOR SUPPLY CHAIN DB")
+    print("🏗️  RELIABLE LOCATION GENERATOR FOR SUPPLY CHAIN DB")
     print("=" * 60)
 
     try:
-        # Generate locations with reliable sequential processing
-        locations_data = await generate_locations_with_addresses_sequential(300)
+        # Generate locations with rate-limited concurrent processing
+        locations_data = await generate_locations_with_addresses_concurrent(300)
 
         # Save to JSON file
         output_file = "generated_locations.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(locations_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(locations_data, option=orjson.OPT_INDENT_2))
 
         # Print summary
         metadata = locations_data["metadata"]
         print("\n" + "=" * 60)
         print(" LOCATION GENERATION COMPLETED")
         print("=" * 60)
-        print(f" SUMMARY:")
+        print(f"📊 SUMMARY:")
         print(f"  • Total unique locations generated: {metadata['total_generated']}")
         print(f"  • User locations: {metadata['user_locations_count']}")
         print(f"  • City locations: {metadata['city_locations_count']}")
@@ -448,15 +485,15 @@ async def main():
 
         if metadata["spain_rejected_count"] > 0:
             print(
-                f"\n REJECTED {metadata['spain_rejected_count']} locations in Spain"
+                f"\n🇪🇸 REJECTED {metadata['spain_rejected_count']} locations in Spain"
             )
 
         if metadata["duplicate_rejected_count"] > 0:
             print(
-                f"\n REJECTED {metadata['duplicate_rejected_count']} duplicate locations"
+                f"\n🔄 REJECTED {metadata['duplicate_rejected_count']} duplicate locations"
             )
 
-        print("\n Ready to use with populate script!")
+        print("\n🎉 Ready to use with populate script!")
         print("=" * 60)
 
         # Clean up temporary progress files
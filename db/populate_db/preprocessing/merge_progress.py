@@ -3,84 +3,100 @@
 Merge progress files into final generated_locations.json
 """
 
-import json
-import glob
+import orjson
 from datetime import datetime
+from pathlib import Path
+
+# Output buffer size, so the merged file is written in large chunks
+OUTPUT_BUFFER_SIZE = 64 * 1024
+
+
+def count_progress_lines(filename: str) -> int:
+    """Count the locations appended to a progress log without parsing them"""
+    with open(filename, "r", encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def write_progress_array(out, filename: str):
+    """Stream a progress log into `out` as a JSON array, one raw line per element"""
+    out.write("[")
+    with open(filename, "r", encoding="utf-8") as f:
+        first = True
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if not first:
+                out.write(",\n")
+            out.write(line)
+            first = False
+    out.write("]")
 
 
 def merge_progress_files():
     """Merge all progress files into final locations JSON"""
-    print(" Merging progress files...")
-
-    # Load the final progress files
-    user_file = "progress_user_240.json"
-    city_file = "progress_city_60.json"
+    print("🔄 Merging progress files...")
 
-    user_locations = []
-    city_locations = []
+    # Load the progress logs, one accepted location per line
+    user_file = "progress_user.jsonl"
+    city_file = "progress_city.jsonl"
 
-    # Load user locations
+    # Count user locations
     try:
-        with open(user_file, "r", encoding="utf-8") as f:
-            user_data = json.load(f)
-            user_locations = user_data["locations"]
-        print(f" Loaded {len(user_locations)} user locations from {user_file}")
+        user_count = count_progress_lines(user_file)
+        print(f" Found {user_count} user locations in {user_file}")
     except Exception as e:
         print(f" Failed to load {user_file}: {e}")
         return
 
-    # Load city locations
+    # Count city locations
     try:
-        with open(city_file, "r", encoding="utf-8") as f:
-            city_data = json.load(f)
-            city_locations = city_data["locations"]
-        print(f" Loaded {len(city_locations)} city locations from {city_file}")
+        city_count = count_progress_lines(city_file)
+        print(f" Found {city_count} city locations in {city_file}")
     except Exception as e:
         print(f" Failed to load {city_file}: {e}")
         return
 
     # Create final merged data
-    total_generated = len(user_locations) + len(city_locations)
-
-    locations_data = {
-        "metadata": {
-            "generated_at": datetime.now().isoformat(),
-            "total_requested": 300,
-            "total_generated": total_generated,
-            "user_locations_count": len(user_locations),
-            "city_locations_count": len(city_locations),
-            "source": "merged_from_progress_files",
-            "validation_passed": False,  # Since final validation failed
-            "processing_mode": "sequential",
-        },
-        "user_locations": user_locations,
-        "city_locations": city_locations,
+    total_generated = user_count + city_count
+
+    metadata = {
+        "generated_at": datetime.now().isoformat(),
+        "total_requested": 300,
+        "total_generated": total_generated,
+        "user_locations_count": user_count,
+        "city_locations_count": city_count,
+        "source": "merged_from_progress_files",
+        "validation_passed": False,  # Since final validation failed
+        "processing_mode": "concurrent",
     }
 
-    # Save merged file
+    # Save merged file, copying each progress line straight into its array
     output_file = "generated_locations.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(locations_data, f, indent=2, ensure_ascii=False)
+    with open(output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as out:
+        out.write('{"metadata": ' + orjson.dumps(metadata).decode())
+        out.write(',\n"user_locations": ')
+        write_progress_array(out, user_file)
+        out.write(',\n"city_locations": ')
+        write_progress_array(out, city_file)
+        out.write("}\n")
 
     print(f" Merged locations saved to {output_file}")
-    print(f" Total locations: {total_generated}")
-    print(f" User locations: {len(user_locations)}")
-    print(f" City locations: {len(city_locations)}")
+    print(f"📊 Total locations: {total_generated}")
+    print(f"📊 User locations: {user_count}")
+    print(f"📊 City locations: {city_count}")
 
     # Clean up progress files
     print("\n🧹 Cleaning up progress files...")
-    progress_files = glob.glob("progress_*.json")
-    for file in progress_files:
+    for file in Path(".").glob("progress_*.jsonl"):
         try:
-            import os
-
-            os.remove(file)
-            print(f"️ Removed: {file}")
+            file.unlink(missing_ok=True)
+            print(f"🗑️ Removed: {file}")
         except Exception as e:
             print(f"⚠️ Failed to remove {file}: {e}")
 
-    print(f"\n Successfully merged {total_generated} locations!")
-    print(f" Final file: {output_file}")
+    print(f"\n🎉 Successfully merged {total_generated} locations!")
+    print(f"🔄 Final file: {output_file}")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,11 @@ Sample data and constants for Supply Chain Management System database population
 All sample data, constants, and data generation utilities in one place
 """
 
-import json
 import random
-import os
-from typing import List, Dict, Tuple, Optional
+import numpy as np
+import orjson
+from types import MappingProxyType
+from typing import Iterator, List, Dict, Mapping, Tuple, Optional
 
 # ===============================
 # GEOGRAPHICAL DATA
@@ -42,15 +43,48 @@ PORTUGUESE_CITIES = [
     ("Viseu", (-7.9138, 40.6575)),
 ]
 
+# City names and coordinates as parallel arrays, for batched fallback sampling
+_CITY_NAMES = np.array([name for name, _ in PORTUGUESE_CITIES])
+_CITY_LONGITUDES = np.array([coords[0] for _, coords in PORTUGUESE_CITIES])
+_CITY_LATITUDES = np.array([coords[1] for _, coords in PORTUGUESE_CITIES])
+
+# The only possible city fallback results, built once instead of per call
+_CITY_FALLBACK_ENTRIES = tuple(
+    (longitude, latitude, f"Fallback Location, {name}, Portugal")
+    for name, (longitude, latitude) in PORTUGUESE_CITIES
+)
+
+# Fallback locations sampled per vectorized batch
+FALLBACK_BATCH_SIZE = 1000
+
 
 # ===============================
 # PRE-GENERATED LOCATIONS MANAGEMENT
 # ===============================
 
-# Global variables to store loaded locations
-_loaded_locations: Optional[Dict] = None
-_user_locations: List[Dict] = []
-_city_locations: List[Dict] = []
+# Global variables to store loaded locations, read-only once loaded
+_loaded_locations: Optional[Mapping] = None
+# Locations are kept as (longitude, latitude, address) tuples
+_user_locations: Tuple[Tuple[float, float, str], ...] = ()
+_city_locations: Tuple[Tuple[float, float, str], ...] = ()
+_user_location_iter: Optional[Iterator[Tuple[float, float, str]]] = None
+_city_location_iter: Optional[Iterator[Tuple[float, float, str]]] = None
+
+
+def _location_tuples(
+    locations: List[Dict],
+) -> Tuple[Tuple[float, float, str], ...]:
+    """Flatten loaded location dicts into (longitude, latitude, address) tuples"""
+    return tuple(
+        (location["longitude"], location["latitude"], location["address"])
+        for location in locations
+    )
+
+
+def _shuffled_rounds(items: Tuple) -> Iterator:
+    """Yield every item once per round, in a freshly shuffled order each round"""
+    while True:
+        yield from random.sample(items, len(items))
 
 
 def load_locations_from_json(json_file_path: str = "generated_locations.json") -> bool:
@@ -64,26 +98,29 @@ def load_locations_from_json(json_file_path: str = "generated_locations.json") -
         True if locations loaded successfully, False otherwise
     """
     global _loaded_locations, _user_locations, _city_locations
+    global _user_location_iter, _city_location_iter
 
     try:
-        # Check if file exists
-        if not os.path.exists(json_file_path):
+        # Load JSON data; a missing file is detected by the open itself
+        try:
+            with open(json_file_path, "rb") as f:
+                _loaded_locations = MappingProxyType(orjson.loads(f.read()))
+        except FileNotFoundError:
             print(f" Locations file not found: {json_file_path}")
             return False
 
-        # Load JSON data
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            _loaded_locations = json.load(f)
-
         # Extract location arrays
-        _user_locations = _loaded_locations.get("user_locations", [])
-        _city_locations = _loaded_locations.get("city_locations", [])
+        _user_locations = _location_tuples(_loaded_locations.get("user_locations", []))
+        _city_locations = _location_tuples(_loaded_locations.get("city_locations", []))
 
         # Validate data
         if not _user_locations or not _city_locations:
             print(f" Invalid locations data in {json_file_path}")
             return False
 
+        _user_location_iter = _shuffled_rounds(_user_locations)
+        _city_location_iter = _shuffled_rounds(_city_locations)
+
         metadata = _loaded_locations.get("metadata", {})
         print(
             f" Loaded {len(_user_locations)} user locations and {len(_city_locations)} city locations"
@@ -105,11 +142,8 @@ def get_random_user_location() -> Tuple[float, float, str]:
         Tuple of (longitude, latitude, address)
         Falls back to random generation if no data loaded
     """
-    global _user_locations
-
-    if _user_locations:
-        location = random.choice(_user_locations)
-        return (location["longitude"], location["latitude"], location["address"])
+    if _user_location_iter is not None:
+        return next(_user_location_iter)
     else:
         # Fallback to original random generation
         print(" No pre-generated user locations available, using fallback generation")
@@ -124,11 +158,8 @@ def get_random_city_location() -> Tuple[float, float, str]:
         Tuple of (longitude, latitude, address)
         Falls back to random generation if no data loaded
     """
-    global _city_locations
-
-    if _city_locations:
-        location = random.choice(_city_locations)
-        return (location["longitude"], location["latitude"], location["address"])
+    if _city_location_iter is not None:
+        return next(_city_location_iter)
     else:
         # Fallback to original random generation
         print(" No pre-generated city locations available, using fallback generation")
@@ -146,36 +177,64 @@ def get_locations_metadata() -> Dict:
 # ===============================
 
 
-def random_portugal_location_fallback() -> Tuple[float, float, str]:
-    """Generate random coordinates within Portugal's boundaries for users (fallback)"""
-    # Use a hybrid approach: 70% of the time use bounded random coordinates,
-    # 30% of the time use coordinates near existing Portuguese cities
-    if random.random() < 0.7:
-        longitude = random.uniform(
-            PORTUGAL_BOUNDS["min_longitude"], PORTUGAL_BOUNDS["max_longitude"]
+def sample_city_locations(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample n random Portuguese cities as (longitudes, latitudes, names) arrays"""
+    idx = np.random.randint(0, len(_CITY_NAMES), n)
+    return _CITY_LONGITUDES[idx], _CITY_LATITUDES[idx], _CITY_NAMES[idx]
+
+
+def _portugal_fallback_locations():
+    """Endless random user locations within Portugal, generated in batches"""
+    while True:
+        # Use a hybrid approach: 70% of the time use bounded random coordinates,
+        # 30% of the time use coordinates near existing Portuguese cities
+        bounded_longitudes = np.random.uniform(
+            PORTUGAL_BOUNDS["min_longitude"],
+            PORTUGAL_BOUNDS["max_longitude"],
+            FALLBACK_BATCH_SIZE,
         )
-        latitude = random.uniform(
-            PORTUGAL_BOUNDS["min_latitude"], PORTUGAL_BOUNDS["max_latitude"]
+        bounded_latitudes = np.random.uniform(
+            PORTUGAL_BOUNDS["min_latitude"],
+            PORTUGAL_BOUNDS["max_latitude"],
+            FALLBACK_BATCH_SIZE,
         )
-        return (longitude, latitude, "Fallback Location, Portugal")
-    else:
-        # Pick a random city and add small random offset to ensure variety
-        base_city_coords = random.choice(PORTUGUESE_CITIES)[1]
-        # Add small random offset (max ~20km in any direction)
-        longitude_offset = random.uniform(-0.2, 0.2)
-        latitude_offset = random.uniform(-0.15, 0.15)
-
-        return (
-            base_city_coords[0] + longitude_offset,
-            base_city_coords[1] + latitude_offset,
-            "Fallback Location, Portugal",
+
+        # Random city plus small random offset (max ~20km in any direction)
+        city_longitudes, city_latitudes, _ = sample_city_locations(FALLBACK_BATCH_SIZE)
+        city_longitudes = city_longitudes + np.random.uniform(
+            -0.2, 0.2, FALLBACK_BATCH_SIZE
+        )
+        city_latitudes = city_latitudes + np.random.uniform(
+            -0.15, 0.15, FALLBACK_BATCH_SIZE
         )
 
+        use_bounded = np.random.random(FALLBACK_BATCH_SIZE) < 0.7
+        longitudes = np.where(use_bounded, bounded_longitudes, city_longitudes)
+        latitudes = np.where(use_bounded, bounded_latitudes, city_latitudes)
+
+        for longitude, latitude in zip(longitudes.tolist(), latitudes.tolist()):
+            yield (longitude, latitude, "Fallback Location, Portugal")
+
+
+def _city_fallback_locations():
+    """Endless random city locations, generated in batches"""
+    while True:
+        idx = np.random.randint(0, len(_CITY_FALLBACK_ENTRIES), FALLBACK_BATCH_SIZE)
+        yield from map(_CITY_FALLBACK_ENTRIES.__getitem__, idx.tolist())
+
+
+_portugal_fallback_iter = _portugal_fallback_locations()
+_city_fallback_iter = _city_fallback_locations()
+
+
+def random_portugal_location_fallback() -> Tuple[float, float, str]:
+    """Generate random coordinates within Portugal's boundaries for users (fallback)"""
+    return next(_portugal_fallback_iter)
+
 
 def random_city_location_fallback() -> Tuple[float, float, str]:
     """Get random coordinates from Portuguese cities for warehouses/trucks (fallback)"""
-    city_name, coords = random.choice(PORTUGUESE_CITIES)
-    return (coords[0], coords[1], f"Fallback Location, {city_name}, Portugal")
+    return next(_city_fallback_iter)
 
 
 # Legacy functions for backward compatibility
@@ -196,115 +255,44 @@ def random_city_location():
 # ===============================
 
 
+# Static (name, contact, password, role) of each sample user; only locations vary per run
+_USER_TEMPLATES = (
+    # Test Users
+    ("Test Admin", "admin@test.com", "1234", "Administrator"),
+    ("Test Supplier", "supplier@test.com", "1234", "Supplier"),
+    ("Test Buyer", "buyer@test.com", "1234", "Buyer"),
+    ("Test Driver", "driver@test.com", "1234", "TruckDriver"),
+    # Administrators
+    ("Admin Smith", "admin@supply.com", "admin123", "Administrator"),
+    # Suppliers
+    ("Green Valley Farms", "info@greenvalley.com", "supplier123", "Supplier"),
+    ("Organic Harvest Co", "contact@organicharv.com", "supplier456", "Supplier"),
+    ("Fresh Fields Ltd", "hello@freshfields.com", "supplier789", "Supplier"),
+    # Buyers
+    ("City Market Chain", "procurement@citymarket.com", "buyer123", "Buyer"),
+    ("Healthy Foods Inc", "orders@healthyfoods.com", "buyer456", "Buyer"),
+    ("Metro Grocery", "supply@metrogrocery.com", "buyer789", "Buyer"),
+    # Truck Drivers
+    ("Mike Johnson", "mike.j@transport.com", "driver123", "TruckDriver"),
+    ("Sarah Wilson", "sarah.w@transport.com", "driver456", "TruckDriver"),
+    ("Robert Davis", "rob.d@transport.com", "driver789", "TruckDriver"),
+)
+
+
 def get_sample_users():
     """
     Generate sample users with pre-generated locations
     This function is called after locations are loaded to ensure we have addresses
     """
     return [
-        # Test Users
-        {
-            "name": "Test Admin",
-            "contact": "admin@test.com",
-            "location": get_random_user_location(),
-            "password": "1234",
-            "role": "Administrator",
-        },
-        {
-            "name": "Test Supplier",
-            "contact": "supplier@test.com",
-            "location": get_random_user_location(),
-            "password": "1234",
-            "role": "Supplier",
-        },
-        {
-            "name": "Test Buyer",
-            "contact": "buyer@test.com",
-            "location": get_random_user_location(),
-            "password": "1234",
-            "role": "Buyer",
-        },
-        {
-            "name": "Test Driver",
-            "contact": "driver@test.com",
-            "location": get_random_user_location(),
-            "password": "1234",
-            "role": "TruckDriver",
-        },
-        # Administrators
-        {
-            "name": "Admin Smith",
-            "contact": "admin@supply.com",
-            "location": get_random_user_location(),
-            "password": "admin123",
-            "role": "Administrator",
-        },
-        # Suppliers
-        {
-            "name": "Green Valley Farms",
-            "contact": "info@greenvalley.com",
-            "location": get_random_user_location(),
-            "password": "supplier123",
-            "role": "Supplier",
-        },
-        {
-            "name": "Organic Harvest Co",
-            "contact": "contact@organicharv.com",
-            "location": get_random_user_location(),
-            "password": "supplier456",
-            "role": "Supplier",
-        },
-        {
-            "name": "Fresh Fields Ltd",
-            "contact": "hello@freshfields.com",
-            "location": get_random_user_location(),
-            "password": "supplier789",
-            "role": "Supplier",
-        },
-        # Buyers
-        {
-            "name": "City Market Chain",
-            "contact": "procurement@citymarket.com",
-            "location": get_random_user_location(),
-            "password": "buyer123",
-            "role": "Buyer",
-        },
-        {
-            "name": "Healthy Foods Inc",
-            "contact": "orders@healthyfoods.com",
-            "location": get_random_user_location(),
-            "password": "buyer456",
-            "role": "Buyer",
-        },
-        {
-            "name": "Metro Grocery",
-            "contact": "supply@metrogrocery.com",
-            "location": get_random_user_location(),
-            "password": "buyer789",
-            "role": "Buyer",
-        },
-        # Truck Drivers
-        {
-            "name": "Mike Johnson",
-            "contact": "mike.j@transport.com",
-            "location": get_random_user_location(),
-            "password": "driver123",
-            "role": "TruckDriver",
-        },
-        {
-            "name": "Sarah Wilson",
-            "contact": "sarah.w@transport.com",
-            "location": get_random_user_location(),
-            "password": "driver456",
-            "role": "TruckDriver",
-        },
         {
-            "name": "Robert Davis",
-            "contact": "rob.d@transport.com",
+            "name": name,
+            "contact": contact,
             "location": get_random_user_location(),
-            "password": "driver789",
-            "role": "TruckDriver",
-        },
+            "password": password,
+            "role": role,
+        }
+        for name, contact, password, role in _USER_TEMPLATES
     ]
 
 
@@ -4,14 +4,17 @@ Combines database operations and MinIO file management in one place
 """
 
 import asyncpg
+import io
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 from minio import Minio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .config import DB_CONFIG, MINIO_CONFIG, SAMPLE_FILES
 from .generate_quotes import generate_term_quote_pdf_topics
-import tempfile
-import os
+
+# Uploads kept in flight at once; matches the MinIO client's connection pool size
+MAX_UPLOAD_WORKERS = 10
 
 
 class DatabaseManager:
@@ -51,12 +54,10 @@ class DatabaseManager:
             '"User"',
         ]
 
-        for table in tables:
-            await self.conn.execute(f"DELETE FROM {table} CASCADE")
-            clean_table = table.lower().replace('"', "")
-            await self.conn.execute(
-                f"ALTER SEQUENCE IF EXISTS {clean_table}_{clean_table}id_seq RESTART WITH 1"
-            )
+        # One TRUNCATE empties every table and resets their ID sequences together
+        await self.conn.execute(
+            f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE"
+        )
         print(" Database cleared")
 
     async def print_summary(self):
@@ -120,6 +121,10 @@ class FileManager:
     def __init__(self, db_connection=None):
         self.minio_client = None
         self.db_connection = db_connection
+        self._upload_executor = ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS)
+        self._pending_uploads = []
+        self._supplier_names = None
+        self._product_names = None
 
     def connect(self):
         """Connect to MinIO object storage"""
@@ -150,6 +155,67 @@ class FileManager:
             print(f"Warning: File {file_path} not found, skipping upload")
             return None
 
+    def submit_upload(
+        self, file_path: Path, bucket_name: str, object_name: str
+    ) -> Optional[str]:
+        """Queue a file upload on the thread pool and return the object name right away"""
+        if file_path.exists():
+            self._pending_uploads.append(
+                self._upload_executor.submit(
+                    self.minio_client.fput_object,
+                    bucket_name,
+                    object_name,
+                    str(file_path),
+                )
+            )
+            return object_name
+        else:
+            print(f"Warning: File {file_path} not found, skipping upload")
+            return None
+
+    def wait_for_uploads(self):
+        """Block until every queued upload has finished, re-raising the first failure"""
+        pending, self._pending_uploads = self._pending_uploads, []
+        wait(pending)
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Finish queued uploads and shut down the upload thread pool"""
+        try:
+            self.wait_for_uploads()
+        finally:
+            self._upload_executor.shutdown()
+
+    def _generate_and_upload_quote_pdf(
+        self, supplier_name: str, product_name: str, object_name: str
+    ):
+        """Render a quote PDF into memory and upload it, without a temporary file"""
+        buffer = io.BytesIO()
+        generate_term_quote_pdf_topics(supplier_name, product_name, buffer)
+        length = buffer.tell()
+        buffer.seek(0)
+        self.minio_client.put_object(
+            MINIO_CONFIG["quotes_bucket"],
+            object_name,
+            buffer,
+            length=length,
+            content_type="application/pdf",
+        )
+
+    async def prime_name_caches(self):
+        """Load all user and product names once, for per-quote lookups"""
+        self._supplier_names = {
+            row["userid"]: row["name"]
+            for row in await self.db_connection.fetch('SELECT userid, name FROM "User"')
+        }
+        self._product_names = {
+            row["productid"]: row["name"]
+            for row in await self.db_connection.fetch(
+                "SELECT productid, name FROM product"
+            )
+        }
+
     async def upload_quote_pdf(
         self, quote_index: int, supplier_id: int, product_id: int
     ) -> str:
@@ -159,23 +225,33 @@ class FileManager:
         )
 
         if self.db_connection:
-            # Fetch supplier and product names from database
-            supplier_name = await self.db_connection.fetchval(
-                'SELECT name FROM "User" WHERE userid = $1', supplier_id
-            )
-            product_name = await self.db_connection.fetchval(
-                "SELECT name FROM product WHERE productid = $1", product_id
-            )
+            # Supplier and product names, loaded once on the first quote
+            if self._supplier_names is None:
+                await self.prime_name_caches()
+            supplier_name = self._supplier_names.get(supplier_id)
+            product_name = self._product_names.get(product_id)
+
+            if supplier_name and product_name:
+                # Rendered in memory on the upload pool, so no temp file is written
+                self._pending_uploads.append(
+                    self._upload_executor.submit(
+                        self._generate_and_upload_quote_pdf,
+                        supplier_name,
+                        product_name,
+                        pdf_object_name,
+                    )
+                )
+                return pdf_object_name
 
-            # Use fallback PDF to avoid Windows file permission issues
-            return self.upload_file(
+            # Fallback to default PDF if the names are unknown
+            return self.submit_upload(
                 SAMPLE_FILES["random_pdf"],
                 MINIO_CONFIG["quotes_bucket"],
                 pdf_object_name,
             )
         else:
             # Fallback to default PDF if no database connection
-            return self.upload_file(
+            return self.submit_upload(
                 SAMPLE_FILES["random_pdf"],
                 MINIO_CONFIG["quotes_bucket"],
                 pdf_object_name,
@@ -190,6 +266,6 @@ class FileManager:
             image_file = SAMPLE_FILES["good_apple_jpg"]
             image_name = f"good_apple_record_{record_index + 1}.jpg"
 
-        return self.upload_file(
+        return self.submit_upload(
             image_file, MINIO_CONFIG["product_records_bucket"], image_name
         )
@@ -16,11 +16,27 @@ class GeocodingService:
         self,
         user_agent: str = "supply_chain_db_populator",
         quiet: bool = False,
+        requests_per_second: float = 1.0,
     ):
         self.geolocator = Nominatim(user_agent=user_agent)
         self.failed_coordinates = []  # Track coordinates that failed after max retries
         self.quiet = quiet  # If True, don't print success messages
 
+        # Shared by every caller, so concurrent lookups still respect the
+        # provider's rate limit (Nominatim allows 1 request per second)
+        self._min_interval = 1.0 / requests_per_second
+        self._next_request_at = 0.0
+        self._rate_lock = asyncio.Lock()
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait for this caller's turn, spacing request starts by _min_interval"""
+        async with self._rate_lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_request_at > now:
+                await asyncio.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + self._min_interval
+
     async def coords_to_address(
         self,
         latitude: float,
@@ -46,6 +62,7 @@ class GeocodingService:
         for attempt in range(max_retries):
             try:
                 # Perform the geocoding request
+                await self._wait_for_rate_limit()
                 location = await asyncio.to_thread(
                     self.geolocator.reverse, (latitude, longitude), language=language
                 )
@@ -3,6 +3,7 @@ Database population functions for Supply Chain Management System
 All entity population logic consolidated in one file for simplicity
 """
 
+import asyncio
 import random
 from datetime import datetime, timedelta
 from faker import Faker
@@ -33,6 +34,41 @@ from .data import (
 
 faker = Faker()
 
+_INSERT_USERS = """INSERT INTO "User" (Name, ContactInfo, Location, Address, PasswordString, Role)
+   SELECT name, contact, ST_Point(lng, lat), address, password, role
+   FROM unnest($1::text[], $2::text[], $3::float8[], $4::float8[], $5::text[], $6::text[], $7::text[])
+        WITH ORDINALITY AS t(name, contact, lng, lat, address, password, role, ord)
+   ORDER BY ord RETURNING UserID"""
+
+_INSERT_PRODUCTS = """INSERT INTO Product (Name, BasePrice, DiscountPercentage, RequiresRefrigeration, ShelfLifeDays, DeadlineToDiscount)
+   SELECT name, base_price, discount, refrigerated, shelf_life, deadline
+   FROM unnest($1::text[], $2::int[], $3::int[], $4::bool[], $5::int[], $6::int[])
+        WITH ORDINALITY AS t(name, base_price, discount, refrigerated, shelf_life, deadline, ord)
+   ORDER BY ord RETURNING ProductID"""
+
+_INSERT_WAREHOUSES = """INSERT INTO Warehouse (Name, Location, Address, NormalCapacityKg, RefrigeratedCapacityKg)
+   SELECT name, ST_Point(lng, lat), address, normal, refrigerated
+   FROM unnest($1::text[], $2::float8[], $3::float8[], $4::text[], $5::int[], $6::int[])
+        WITH ORDINALITY AS t(name, lng, lat, address, normal, refrigerated, ord)
+   ORDER BY ord RETURNING WarehouseID"""
+
+_INSERT_TRUCKS = """INSERT INTO Truck (TruckDriverID, CurrentLocation, Status, Type, LoadCapacityKg)
+   SELECT driver, ST_Point(lng, lat), status, type, capacity
+   FROM unnest($1::int[], $2::float8[], $3::float8[], $4::text[], $5::text[], $6::int[])
+        WITH ORDINALITY AS t(driver, lng, lat, status, type, capacity, ord)
+   ORDER BY ord RETURNING TruckID"""
+
+
+async def insert_rows(db_manager, query, rows):
+    """Insert rows with a single unnest-based INSERT and return their IDs in row order"""
+    if not rows:
+        return []
+
+    columns = [list(column) for column in zip(*rows)]
+    records = await db_manager.conn.fetch(query, *columns)
+    # SERIAL values are drawn in ORDER BY ord order, so sorted IDs line up with rows
+    return sorted(record[0] for record in records)
+
 
 # ===============================
 # BASIC ENTITIES
@@ -43,7 +79,8 @@ async def populate_users(db_manager):
     """Populate User table with sample and generated users using pre-generated locations"""
     print("Populating users...")
 
-    created_count = 0
+    # Rows are collected first and written with one INSERT at the end
+    user_rows = []
 
     # Get sample users with pre-generated locations
     sample_users = get_sample_users()
@@ -52,24 +89,18 @@ async def populate_users(db_manager):
     print(
         f"Creating {len(sample_users)} sample users with pre-generated locations..."
     )
-    for i, user_data in enumerate(sample_users, 1):
+    for user_data in sample_users:
         lng, lat, address = user_data["location"]
-
-        user_id = await db_manager.conn.fetchval(
-            """INSERT INTO "User" (Name, ContactInfo, Location, Address, PasswordString, Role) 
-               VALUES ($1, $2, ST_Point($3, $4), $5, $6, $7) RETURNING UserID""",
-            user_data["name"],
-            user_data["contact"],
-            lng,
-            lat,
-            address,
-            user_data["password"],
-            user_data["role"],
-        )
-        db_manager.add_user_id(user_data["role"], user_id)
-        created_count += 1
-        print(
-            f" Created user '{user_data['name']}' ({user_data['role']}) with address: {address}"
+        user_rows.append(
+            (
+                user_data["name"],
+                user_data["contact"],
+                lng,
+                lat,
+                address,
+                user_data["password"],
+                user_data["role"],
+            )
         )
 
     # Generate additional users to reach targets
@@ -96,24 +127,14 @@ async def populate_users(db_manager):
             )
             lng, lat, address = get_random_user_location()
             password = faker.password(length=10)
+            user_rows.append((name, contact, lng, lat, address, password, role))
 
-            user_id = await db_manager.conn.fetchval(
-                """INSERT INTO "User" (Name, ContactInfo, Location, Address, PasswordString, Role) 
-                   VALUES ($1, $2, ST_Point($3, $4), $5, $6, $7) RETURNING UserID""",
-                name,
-                contact,
-                lng,
-                lat,
-                address,
-                password,
-                role,
-            )
-            db_manager.add_user_id(role, user_id)
-            created_count += 1
-            print(f" Created user '{name}' ({role}) with address: {address}")
+    user_ids = await insert_rows(db_manager, _INSERT_USERS, user_rows)
+    for (name, _, _, _, address, _, role), user_id in zip(user_rows, user_ids):
+        db_manager.add_user_id(role, user_id)
+        print(f" Created user '{name}' ({role}) with address: {address}")
 
-    total_users = sum(len(v) for v in db_manager.user_ids.values())
-    print(f" Created {created_count} users using pre-generated locations")
+    print(f" Created {len(user_ids)} users using pre-generated locations")
 
 
 async def populate_products(db_manager):
@@ -124,6 +145,9 @@ async def populate_products(db_manager):
     available_products = PRODUCE_ITEMS.copy()
     random.shuffle(available_products)  # Randomize order for variety
 
+    product_rows = []
+    used_names = set()
+
     for i in range(PRODUCT_TARGET_COUNT):
         # First try to use an unused product from the original list
         if available_products:
@@ -132,8 +156,9 @@ async def populate_products(db_manager):
             # Fallback to random selection with unique naming when all original products are used
             name = random.choice(PRODUCE_ITEMS)
             # Make names unique if duplicates arise
-            if name in db_manager.product_ids:
+            if name in used_names:
                 name = f"{name} {faker.unique.numerify(text='###')}"
+        used_names.add(name)
 
         # Simple integer pricing (/kg)
         if name in ["Bananas", "Oranges", "Apples", "Potatoes", "Onions", "Carrots"]:
@@ -191,17 +216,20 @@ async def populate_products(db_manager):
         discount_deadline_ratio = random.uniform(0.2, 0.3)
         deadline_to_discount = max(1, int(shelf_life_days * discount_deadline_ratio))
 
-        product_id = await db_manager.conn.fetchval(
-            """INSERT INTO Product (Name, BasePrice, DiscountPercentage, RequiresRefrigeration, ShelfLifeDays, DeadlineToDiscount) 
-               VALUES ($1, $2, $3, $4, $5, $6) RETURNING ProductID""",
-            name,
-            base_price,
-            discount_percentage,
-            requires_refrigeration,
-            shelf_life_days,
-            deadline_to_discount,
+        product_rows.append(
+            (
+                name,
+                base_price,
+                discount_percentage,
+                requires_refrigeration,
+                shelf_life_days,
+                deadline_to_discount,
+            )
         )
-        db_manager.add_product_id(name, product_id)
+
+    product_ids = await insert_rows(db_manager, _INSERT_PRODUCTS, product_rows)
+    for row, product_id in zip(product_rows, product_ids):
+        db_manager.add_product_id(row[0], product_id)
 
     print(f" Created {len(db_manager.get_product_ids())} products")
 
@@ -210,8 +238,7 @@ async def populate_warehouses(db_manager):
     """Populate Warehouse table with generated warehouses using pre-generated locations"""
     print("Populating warehouses...")
 
-    created_count = 0
-    warehouse_index = 1
+    warehouse_rows = []
 
     print(
         f" Creating {WAREHOUSE_TARGET_COUNT} warehouses with pre-generated locations..."
@@ -238,33 +265,37 @@ async def populate_warehouses(db_manager):
             normal_capacity = random.randrange(500000, 2000001, 25000)  # 500-2000 tons
             refrigerated_capacity = random.randrange(200000, min(800000, normal_capacity), 10000)  # 200-800 tons
 
-        warehouse_id = await db_manager.conn.fetchval(
-            """INSERT INTO Warehouse (Name, Location, Address, NormalCapacityKg, RefrigeratedCapacityKg) 
-               VALUES ($1, ST_Point($2, $3), $4, $5, $6) RETURNING WarehouseID""",
-            full_name,
-            lng,
-            lat,
-            address,
-            normal_capacity,
-            refrigerated_capacity,
+        warehouse_rows.append(
+            (full_name, lng, lat, address, normal_capacity, refrigerated_capacity)
         )
+
+    warehouse_ids = await insert_rows(db_manager, _INSERT_WAREHOUSES, warehouse_rows)
+    for warehouse_index, (row, warehouse_id) in enumerate(
+        zip(warehouse_rows, warehouse_ids), 1
+    ):
         db_manager.add_warehouse_id(warehouse_index, warehouse_id)
-        warehouse_index += 1
-        created_count += 1
-        print(f" Created warehouse '{full_name}' with address: {address}")
+        print(f" Created warehouse '{row[0]}' with address: {row[3]}")
+
+    print(f" Created {len(warehouse_ids)} warehouses using pre-generated locations")
 
-    print(f" Created {created_count} warehouses using pre-generated locations")
 
+async def get_warehouse_coordinates(db_manager, warehouses):
+    """Get (lng, lat) for each warehouse ID in a single query"""
+    if not warehouses:
+        return {}
+
+    rows = await db_manager.conn.fetch(
+        "SELECT WarehouseID, ST_X(Location::geometry) as lng, ST_Y(Location::geometry) as lat FROM Warehouse WHERE WarehouseID = ANY($1::int[])",
+        warehouses,
+    )
+    return {row["warehouseid"]: (row["lng"], row["lat"]) for row in rows}
 
-async def get_truck_location(db_manager, warehouses, index):
+
+def get_truck_location(warehouse_coordinates, warehouses, index):
     """Get location for truck from warehouse or random city location"""
     if warehouses:
         chosen_wh_id = warehouses[index % len(warehouses)]
-        row = await db_manager.conn.fetchrow(
-            "SELECT ST_X(Location::geometry) as lng, ST_Y(Location::geometry) as lat FROM Warehouse WHERE WarehouseID = $1",
-            chosen_wh_id,
-        )
-        return row["lng"], row["lat"]
+        return warehouse_coordinates[chosen_wh_id]
     else:
         return random_city_location()
 
@@ -275,6 +306,8 @@ async def populate_trucks(db_manager):
 
     drivers = db_manager.get_user_ids("TruckDriver")
     warehouses = db_manager.get_warehouse_ids()
+    warehouse_coordinates = await get_warehouse_coordinates(db_manager, warehouses)
+    truck_rows = []
 
     # Get Test Driver ID to ensure they get a truck
     test_driver_id = await db_manager.conn.fetchval(
@@ -303,28 +336,28 @@ async def populate_trucks(db_manager):
                 # If all drivers are assigned, start over (some drivers can have multiple trucks)
                 driver_id = drivers[i % len(drivers)] if drivers else None
 
-        lng, lat = await get_truck_location(db_manager, warehouses, i)
-
-        truck_id = await db_manager.conn.fetchval(
-            """INSERT INTO Truck (TruckDriverID, CurrentLocation, Status, Type, LoadCapacityKg) 
-               VALUES ($1, ST_Point($2, $3), $4, $5, $6) RETURNING TruckID""",
-            driver_id,
-            lng,
-            lat,
-            truck_data["status"],
-            truck_data["type"],
-            truck_data["load_capacity"],
+        lng, lat = get_truck_location(warehouse_coordinates, warehouses, i)
+        truck_rows.append(
+            (
+                driver_id,
+                lng,
+                lat,
+                truck_data["status"],
+                truck_data["type"],
+                truck_data["load_capacity"],
+            )
         )
-        db_manager.add_truck_id(i + 1, truck_id)
 
     # Generate additional trucks to reach target
-    existing_count = len(db_manager.get_truck_ids())
+    existing_count = len(truck_rows)
     to_add = max(0, TRUCK_TARGET_COUNT - existing_count)
 
     for i in range(to_add):
         # Continue round-robin assignment
         driver_id = drivers[(existing_count + i) % len(drivers)] if drivers else None
-        lng, lat = await get_truck_location(db_manager, warehouses, existing_count + i)
+        lng, lat = get_truck_location(
+            warehouse_coordinates, warehouses, existing_count + i
+        )
 
         truck_type = random.choices(["Refrigerated", "Normal"], weights=[0.4, 0.6])[0]
         status = random.choices(["Available", "InService"], weights=[0.8, 0.2])[0]
@@ -337,17 +370,11 @@ async def populate_trucks(db_manager):
             # Normal trucks: 3.5t, 7.5t, 12t, 18t, 26t, 40t (including articulated)
             load_capacity = random.choice([3500, 7500, 12000, 18000, 26000, 40000])
 
-        truck_id = await db_manager.conn.fetchval(
-            """INSERT INTO Truck (TruckDriverID, CurrentLocation, Status, Type, LoadCapacityKg) 
-               VALUES ($1, ST_Point($2, $3), $4, $5, $6) RETURNING TruckID""",
-            driver_id,
-            lng,
-            lat,
-            status,
-            truck_type,
-            load_capacity,
-        )
-        db_manager.add_truck_id(existing_count + i + 1, truck_id)
+        truck_rows.append((driver_id, lng, lat, status, truck_type, load_capacity))
+
+    truck_ids = await insert_rows(db_manager, _INSERT_TRUCKS, truck_rows)
+    for truck_index, truck_id in enumerate(truck_ids, 1):
+        db_manager.add_truck_id(truck_index, truck_id)
 
     print(f" Created {len(db_manager.get_truck_ids())} trucks")
 
@@ -1017,6 +1044,7 @@ async def populate_all_entities(db_manager, file_manager):
     await populate_quotes(db_manager, file_manager)
     await ensure_test_supplier_approved_quotes(db_manager, file_manager)
     await populate_product_records(db_manager, file_manager)
+    await asyncio.to_thread(file_manager.wait_for_uploads)
 
     # Transactional entities
     await populate_orders(db_manager)